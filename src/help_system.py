@@ -8,17 +8,31 @@ Provides real-time assistance, principle explanations, and remediation guidance.
 Part of project's SDD Constitutional Foundation & Enforcement system.
 """
 
-import json
-import os
+import heapq
+import re
 import sys
-from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
-import argparse
-import textwrap
-
-
-@dataclass
+from bisect import bisect_right
+from collections import defaultdict
+from functools import cached_property, lru_cache, partial
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from dataclasses import dataclass
+
+if TYPE_CHECKING:
+    import textwrap
+
+
+@dataclass(frozen=True, slots=True)
 class ConstitutionalPrinciple:
     """Constitutional principle definition and guidance."""
 
@@ -26,57 +40,48 @@ class ConstitutionalPrinciple:
     short_name: str
     description: str
     why_important: str
-    common_violations: List[str]
-    how_to_fix: List[str]
-    examples: Dict[str, str]  # good/bad examples
-    tools: List[str]  # tools that help enforce this principle
+    common_violations: Tuple[str, ...]
+    how_to_fix: Tuple[str, ...]
+    examples: Tuple[Tuple[str, str], ...]  # (kind, code) pairs, kind good/bad
+    tools: Tuple[str, ...]  # tools that help enforce this principle
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HelpTopic:
     """Help topic with detailed guidance."""
 
     topic: str
     summary: str
     detailed_help: str
-    related_principles: List[str]
-    code_examples: List[str]
-    see_also: List[str]
-
-
-class ConstitutionalHelpSystem:
-    """Main help system for constitutional compliance guidance."""
-
-    def __init__(self):
-        """Initialize the help system with constitutional principles."""
-        self.principles = self._load_constitutional_principles()
-        self.help_topics = self._load_help_topics()
-        self.quick_fixes = self._load_quick_fixes()
-
-    def _load_constitutional_principles(self) -> Dict[str, ConstitutionalPrinciple]:
-        """Load all constitutional principles with detailed guidance."""
-        principles = {}
-
-        # 1. Single Responsibility Principle (SRP)
-        principles["srp"] = ConstitutionalPrinciple(
-            name="Single Responsibility Principle",
-            short_name="SRP",
-            description="Each class, function, or module should have only one reason to change.",
-            why_important="Reduces complexity, improves maintainability, makes testing easier, and enables focused debugging.",
-            common_violations=[
-                "Functions that do multiple unrelated tasks",
-                "Classes that handle both business logic and data persistence",
-                "Modules that mix user interface and business logic",
-                "Functions with multiple return types or purposes",
-            ],
-            how_to_fix=[
-                "Extract each responsibility into its own function/class",
-                "Use composition to combine simple components",
-                "Create separate layers (UI, business logic, data)",
-                "Apply the 'one reason to change' test",
-            ],
-            examples={
-                "good": """
+    related_principles: Tuple[str, ...]
+    code_examples: Tuple[str, ...]
+    see_also: Tuple[str, ...]
+
+
+# One record per constitutional principle; "key" is the help topic name and the
+# remaining fields map onto ConstitutionalPrinciple.
+_PRINCIPLE_DATA: List[Dict[str, Any]] = [
+    # 1. Single Responsibility Principle (SRP)
+    {
+        "key": "srp",
+        "name": "Single Responsibility Principle",
+        "short_name": "SRP",
+        "description": "Each class, function, or module should have only one reason to change.",
+        "why_important": "Reduces complexity, improves maintainability, makes testing easier, and enables focused debugging.",
+        "common_violations": [
+            "Functions that do multiple unrelated tasks",
+            "Classes that handle both business logic and data persistence",
+            "Modules that mix user interface and business logic",
+            "Functions with multiple return types or purposes",
+        ],
+        "how_to_fix": [
+            "Extract each responsibility into its own function/class",
+            "Use composition to combine simple components",
+            "Create separate layers (UI, business logic, data)",
+            "Apply the 'one reason to change' test",
+        ],
+        "examples": {
+            "good": """
 def calculate_tax(subtotal, tax_rate):
     \"\"\"Calculate tax amount only.\"\"\"
     return subtotal * tax_rate
@@ -85,7 +90,7 @@ def format_currency(amount):
     \"\"\"Format amount as currency only.\"\"\"
     return f"${amount:.2f}"
                 """,
-                "bad": """
+            "bad": """
 def process_order_and_format(items, tax_rate, customer_email):
     \"\"\"This function does too many things!\"\"\"
     # Calculate total (responsibility 1)
@@ -101,30 +106,31 @@ def process_order_and_format(items, tax_rate, customer_email):
     
     return total
                 """,
-            },
-            tools=["ruff", "complexity analysis", "code review"],
-        )
-
-        # 2. Encapsulation
-        principles["encapsulation"] = ConstitutionalPrinciple(
-            name="Encapsulation",
-            short_name="Encapsulation",
-            description="Hide internal implementation details and provide controlled access through public interfaces.",
-            why_important="Prevents direct manipulation of internal state, enables safe refactoring, and provides clear contracts.",
-            common_violations=[
-                "Public attributes that should be private",
-                "Direct access to internal data structures",
-                "Missing validation in setters",
-                "Exposing implementation details in public APIs",
-            ],
-            how_to_fix=[
-                "Use private attributes (underscore prefix in Python)",
-                "Provide getter/setter methods with validation",
-                "Create clear public interfaces",
-                "Hide implementation details behind abstractions",
-            ],
-            examples={
-                "good": """
+        },
+        "tools": ["ruff", "complexity analysis", "code review"],
+    },
+
+    # 2. Encapsulation
+    {
+        "key": "encapsulation",
+        "name": "Encapsulation",
+        "short_name": "Encapsulation",
+        "description": "Hide internal implementation details and provide controlled access through public interfaces.",
+        "why_important": "Prevents direct manipulation of internal state, enables safe refactoring, and provides clear contracts.",
+        "common_violations": [
+            "Public attributes that should be private",
+            "Direct access to internal data structures",
+            "Missing validation in setters",
+            "Exposing implementation details in public APIs",
+        ],
+        "how_to_fix": [
+            "Use private attributes (underscore prefix in Python)",
+            "Provide getter/setter methods with validation",
+            "Create clear public interfaces",
+            "Hide implementation details behind abstractions",
+        ],
+        "examples": {
+            "good": """
 class BankAccount:
     def __init__(self, initial_balance=0):
         self._balance = initial_balance  # Private
@@ -138,37 +144,38 @@ class BankAccount:
     def get_balance(self):
         return self._balance
                 """,
-                "bad": """
+            "bad": """
 class BankAccount:
     def __init__(self, initial_balance=0):
         self.balance = initial_balance  # Public - dangerous!
 
 # This allows: account.balance = -1000  # Oops!
                 """,
-            },
-            tools=["linting tools", "access control analysis", "code review"],
-        )
-
-        # 3. Loose Coupling
-        principles["loose_coupling"] = ConstitutionalPrinciple(
-            name="Loose Coupling",
-            short_name="Loose Coupling",
-            description="Components should depend on abstractions, not concrete implementations.",
-            why_important="Enables independent testing, easier refactoring, better modularity, and flexible system architecture.",
-            common_violations=[
-                "Hard-coded dependencies on specific implementations",
-                "Tight coupling between layers",
-                "Direct database access from business logic",
-                "UI components calling business logic directly",
-            ],
-            how_to_fix=[
-                "Use dependency injection",
-                "Define interfaces/abstractions",
-                "Apply layered architecture",
-                "Use event-driven communication",
-            ],
-            examples={
-                "good": """
+        },
+        "tools": ["linting tools", "access control analysis", "code review"],
+    },
+
+    # 3. Loose Coupling
+    {
+        "key": "loose_coupling",
+        "name": "Loose Coupling",
+        "short_name": "Loose Coupling",
+        "description": "Components should depend on abstractions, not concrete implementations.",
+        "why_important": "Enables independent testing, easier refactoring, better modularity, and flexible system architecture.",
+        "common_violations": [
+            "Hard-coded dependencies on specific implementations",
+            "Tight coupling between layers",
+            "Direct database access from business logic",
+            "UI components calling business logic directly",
+        ],
+        "how_to_fix": [
+            "Use dependency injection",
+            "Define interfaces/abstractions",
+            "Apply layered architecture",
+            "Use event-driven communication",
+        ],
+        "examples": {
+            "good": """
 from abc import ABC, abstractmethod
 
 class NotificationService(ABC):
@@ -184,7 +191,7 @@ class OrderProcessor:
         # ... process order ...
         self._notification_service.send("Order confirmed", order.customer)
                 """,
-                "bad": """
+            "bad": """
 import smtplib
 
 class OrderProcessor:
@@ -193,30 +200,31 @@ class OrderProcessor:
         server = smtplib.SMTP('smtp.gmail.com', 587)
         # ... email logic ...
                 """,
-            },
-            tools=["dependency analysis", "architecture review", "interface design"],
-        )
-
-        # 4. Reusability
-        principles["reusability"] = ConstitutionalPrinciple(
-            name="Reusability",
-            short_name="DRY",
-            description="Don't Repeat Yourself - extract common functionality into reusable components.",
-            why_important="Reduces maintenance burden, ensures consistency, and improves code quality through shared components.",
-            common_violations=[
-                "Duplicated validation logic",
-                "Copy-pasted code blocks",
-                "Similar functions with slight variations",
-                "Hardcoded values repeated throughout codebase",
-            ],
-            how_to_fix=[
-                "Extract common code into functions/classes",
-                "Create utility libraries",
-                "Use configuration files for constants",
-                "Apply template/strategy patterns",
-            ],
-            examples={
-                "good": """
+        },
+        "tools": ["dependency analysis", "architecture review", "interface design"],
+    },
+
+    # 4. Reusability
+    {
+        "key": "reusability",
+        "name": "Reusability",
+        "short_name": "DRY",
+        "description": "Don't Repeat Yourself - extract common functionality into reusable components.",
+        "why_important": "Reduces maintenance burden, ensures consistency, and improves code quality through shared components.",
+        "common_violations": [
+            "Duplicated validation logic",
+            "Copy-pasted code blocks",
+            "Similar functions with slight variations",
+            "Hardcoded values repeated throughout codebase",
+        ],
+        "how_to_fix": [
+            "Extract common code into functions/classes",
+            "Create utility libraries",
+            "Use configuration files for constants",
+            "Apply template/strategy patterns",
+        ],
+        "examples": {
+            "good": """
 def validate_email(email):
     \"\"\"Reusable email validation.\"\"\"
     import re
@@ -233,7 +241,7 @@ def update_user_email(user_id, new_email):
         raise ValueError("Invalid email")
     # Update email...
                 """,
-                "bad": """
+            "bad": """
 def create_user(username, email):
     # Duplicated validation logic
     import re
@@ -248,121 +256,146 @@ def update_user_email(user_id, new_email):
     if not re.match(pattern, new_email):
         raise ValueError("Invalid email")
                 """,
-            },
-            tools=["duplicate code detection", "refactoring tools", "code review"],
-        )
-
-        # Add remaining principles (5-8) similarly...
-        principles["portability"] = ConstitutionalPrinciple(
-            name="Portability",
-            short_name="Portability",
-            description="Code should run consistently across different environments and platforms.",
-            why_important="Ensures reliable deployment, easier testing, and better team collaboration.",
-            common_violations=[
-                "Hardcoded file paths",
-                "Environment-specific assumptions",
-                "Platform-dependent code",
-                "Inconsistent dependencies",
-            ],
-            how_to_fix=[
-                "Use environment variables",
-                "Abstract platform differences",
-                "Use relative paths",
-                "Containerize applications",
-            ],
-            examples={
-                "good": "CONFIG_PATH = os.getenv('CONFIG_PATH', 'config/default.json')",
-                "bad": "CONFIG_PATH = '/home/user/myapp/config.json'",
-            },
-            tools=[
-                "environment management",
-                "containerization",
-                "cross-platform testing",
-            ],
+        },
+        "tools": ["duplicate code detection", "refactoring tools", "code review"],
+    },
+
+    # 5. Portability
+    {
+        "key": "portability",
+        "name": "Portability",
+        "short_name": "Portability",
+        "description": "Code should run consistently across different environments and platforms.",
+        "why_important": "Ensures reliable deployment, easier testing, and better team collaboration.",
+        "common_violations": [
+            "Hardcoded file paths",
+            "Environment-specific assumptions",
+            "Platform-dependent code",
+            "Inconsistent dependencies",
+        ],
+        "how_to_fix": [
+            "Use environment variables",
+            "Abstract platform differences",
+            "Use relative paths",
+            "Containerize applications",
+        ],
+        "examples": {
+            "good": "CONFIG_PATH = os.getenv('CONFIG_PATH', 'config/default.json')",
+            "bad": "CONFIG_PATH = '/home/user/myapp/config.json'",
+        },
+        "tools": [
+            "environment management",
+            "containerization",
+            "cross-platform testing",
+        ],
+    },
+
+    # 6. Defensibility
+    {
+        "key": "defensibility",
+        "name": "Defensibility",
+        "short_name": "Security",
+        "description": "Security by design with input validation and secure defaults.",
+        "why_important": "Protects against vulnerabilities, ensures data integrity, and maintains user trust.",
+        "common_violations": [
+            "Missing input validation",
+            "SQL injection vulnerabilities",
+            "Insecure defaults",
+            "Exposed sensitive data",
+        ],
+        "how_to_fix": [
+            "Validate all inputs",
+            "Use parameterized queries",
+            "Apply principle of least privilege",
+            "Encrypt sensitive data",
+        ],
+        "examples": {
+            "good": "cursor.execute('SELECT * FROM users WHERE id = ?', (user_id,))",
+            "bad": "cursor.execute(f'SELECT * FROM users WHERE id = {user_id}')",
+        },
+        "tools": ["bandit", "security scanning", "vulnerability assessment"],
+    },
+
+    # 7. Maintainability
+    {
+        "key": "maintainability",
+        "name": "Maintainability",
+        "short_name": "Maintainability",
+        "description": "Code should be self-documenting with clear naming and comprehensive tests.",
+        "why_important": "Reduces onboarding time, enables safe refactoring, and improves long-term productivity.",
+        "common_violations": [
+            "Unclear variable names",
+            "Missing documentation",
+            "Low test coverage",
+            "Complex nested logic",
+        ],
+        "how_to_fix": [
+            "Use descriptive names",
+            "Add comprehensive docstrings",
+            "Write thorough tests",
+            "Refactor complex functions",
+        ],
+        "examples": {
+            "good": "def calculate_monthly_payment(principal, annual_rate, years):",
+            "bad": "def calc(p, r, y):",
+        },
+        "tools": ["pytest", "coverage analysis", "documentation tools"],
+    },
+
+    # 8. Simplicity
+    {
+        "key": "simplicity",
+        "name": "Simplicity",
+        "short_name": "YAGNI",
+        "description": "You Aren't Gonna Need It - prefer simple solutions over complex ones.",
+        "why_important": "Reduces cognitive load, minimizes bugs, and speeds up development.",
+        "common_violations": [
+            "Over-engineering solutions",
+            "Premature optimization",
+            "Unnecessary abstractions",
+            "Complex inheritance hierarchies",
+        ],
+        "how_to_fix": [
+            "Start with simple solutions",
+            "Refactor when complexity is needed",
+            "Avoid speculative features",
+            "Prefer composition over inheritance",
+        ],
+        "examples": {
+            "good": "return max(numbers) if numbers else 0",
+            "bad": "# 20 lines of complex logic to find maximum",
+        },
+        "tools": ["complexity analysis", "code review", "refactoring tools"],
+    },
+]
+
+
+def _build_constitutional_principles() -> Dict[str, ConstitutionalPrinciple]:
+    """Load all constitutional principles with detailed guidance."""
+    return {
+        record["key"]: ConstitutionalPrinciple(
+            name=record["name"],
+            short_name=record["short_name"],
+            description=record["description"],
+            why_important=record["why_important"],
+            # Tuples, so principles are immutable all the way down and hashable
+            common_violations=tuple(record["common_violations"]),
+            how_to_fix=tuple(record["how_to_fix"]),
+            examples=tuple(record["examples"].items()),
+            tools=tuple(record["tools"]),
         )
+        for record in _PRINCIPLE_DATA
+    }
 
-        principles["defensibility"] = ConstitutionalPrinciple(
-            name="Defensibility",
-            short_name="Security",
-            description="Security by design with input validation and secure defaults.",
-            why_important="Protects against vulnerabilities, ensures data integrity, and maintains user trust.",
-            common_violations=[
-                "Missing input validation",
-                "SQL injection vulnerabilities",
-                "Insecure defaults",
-                "Exposed sensitive data",
-            ],
-            how_to_fix=[
-                "Validate all inputs",
-                "Use parameterized queries",
-                "Apply principle of least privilege",
-                "Encrypt sensitive data",
-            ],
-            examples={
-                "good": "cursor.execute('SELECT * FROM users WHERE id = ?', (user_id,))",
-                "bad": "cursor.execute(f'SELECT * FROM users WHERE id = {user_id}')",
-            },
-            tools=["bandit", "security scanning", "vulnerability assessment"],
-        )
-
-        principles["maintainability"] = ConstitutionalPrinciple(
-            name="Maintainability",
-            short_name="Maintainability",
-            description="Code should be self-documenting with clear naming and comprehensive tests.",
-            why_important="Reduces onboarding time, enables safe refactoring, and improves long-term productivity.",
-            common_violations=[
-                "Unclear variable names",
-                "Missing documentation",
-                "Low test coverage",
-                "Complex nested logic",
-            ],
-            how_to_fix=[
-                "Use descriptive names",
-                "Add comprehensive docstrings",
-                "Write thorough tests",
-                "Refactor complex functions",
-            ],
-            examples={
-                "good": "def calculate_monthly_payment(principal, annual_rate, years):",
-                "bad": "def calc(p, r, y):",
-            },
-            tools=["pytest", "coverage analysis", "documentation tools"],
-        )
-
-        principles["simplicity"] = ConstitutionalPrinciple(
-            name="Simplicity",
-            short_name="YAGNI",
-            description="You Aren't Gonna Need It - prefer simple solutions over complex ones.",
-            why_important="Reduces cognitive load, minimizes bugs, and speeds up development.",
-            common_violations=[
-                "Over-engineering solutions",
-                "Premature optimization",
-                "Unnecessary abstractions",
-                "Complex inheritance hierarchies",
-            ],
-            how_to_fix=[
-                "Start with simple solutions",
-                "Refactor when complexity is needed",
-                "Avoid speculative features",
-                "Prefer composition over inheritance",
-            ],
-            examples={
-                "good": "return max(numbers) if numbers else 0",
-                "bad": "# 20 lines of complex logic to find maximum",
-            },
-            tools=["complexity analysis", "code review", "refactoring tools"],
-        )
 
-        return principles
+def _build_help_topics() -> Dict[str, HelpTopic]:
+    """Load help topics with detailed guidance."""
+    topics = {}
 
-    def _load_help_topics(self) -> Dict[str, HelpTopic]:
-        """Load help topics with detailed guidance."""
-        topics = {}
-
-        topics["getting-started"] = HelpTopic(
-            topic="Getting Started with Constitutional Compliance",
-            summary="Quick setup guide for constitutional enforcement",
-            detailed_help="""
+    topics["getting-started"] = HelpTopic(
+        topic="Getting Started with Constitutional Compliance",
+        summary="Quick setup guide for constitutional enforcement",
+        detailed_help="""
 Constitutional compliance at project is about building maintainable, secure, and scalable software.
 
 Quick Start:
@@ -374,15 +407,15 @@ Quick Start:
 
 The system enforces 8 core SE principles automatically through quality gates.
             """,
-            related_principles=["srp", "maintainability", "simplicity"],
-            code_examples=[],
-            see_also=["quality-gates", "pre-commit", "dashboard"],
-        )
+        related_principles=("srp", "maintainability", "simplicity"),
+        code_examples=(),
+        see_also=("quality-gates", "pre-commit", "dashboard"),
+    )
 
-        topics["quality-gates"] = HelpTopic(
-            topic="Quality Gates & Enforcement",
-            summary="Understanding the automated quality gates",
-            detailed_help="""
+    topics["quality-gates"] = HelpTopic(
+        topic="Quality Gates & Enforcement",
+        summary="Understanding the automated quality gates",
+        detailed_help="""
 Quality gates are automated checks that enforce constitutional principles:
 
 1. Code Quality (Ruff): Checks for style, complexity, and potential bugs
@@ -392,15 +425,15 @@ Quality gates are automated checks that enforce constitutional principles:
 
 Failed quality gates block commits and deployments until fixed.
             """,
-            related_principles=["maintainability", "defensibility", "simplicity"],
-            code_examples=[],
-            see_also=["getting-started", "violations", "dashboard"],
-        )
+        related_principles=("maintainability", "defensibility", "simplicity"),
+        code_examples=(),
+        see_also=("getting-started", "violations", "dashboard"),
+    )
 
-        topics["violations"] = HelpTopic(
-            topic="Common Violations & How to Fix Them",
-            summary="Guide to resolving constitutional violations",
-            detailed_help="""
+    topics["violations"] = HelpTopic(
+        topic="Common Violations & How to Fix Them",
+        summary="Guide to resolving constitutional violations",
+        detailed_help="""
 Most common violations and their fixes:
 
 1. High Complexity: Break large functions into smaller ones
@@ -411,22 +444,23 @@ Most common violations and their fixes:
 
 Use 'constitutional-help fix <violation-type>' for specific guidance.
             """,
-            related_principles=[
-                "srp",
-                "reusability",
-                "maintainability",
-                "defensibility",
-            ],
-            code_examples=[],
-            see_also=["quality-gates", "principles", "tools"],
-        )
+        related_principles=(
+            "srp",
+            "reusability",
+            "maintainability",
+            "defensibility",
+        ),
+        code_examples=(),
+        see_also=("quality-gates", "principles", "tools"),
+    )
+
+    return topics
 
-        return topics
 
-    def _load_quick_fixes(self) -> Dict[str, str]:
-        """Load quick fix templates for common violations."""
-        return {
-            "complexity": """
+def _build_quick_fixes() -> Dict[str, str]:
+    """Load quick fix templates for common violations."""
+    return {
+        "complexity": """
 To fix high complexity:
 
 1. Identify the complex function
@@ -451,7 +485,7 @@ def meets_criteria(data):
 def transform_data(data):
     # ... transformation logic
             """,
-            "coverage": """
+        "coverage": """
 To fix low test coverage:
 
 1. Identify uncovered code: pytest --cov=. --cov-report=html
@@ -469,7 +503,7 @@ def test_calculate_tax_zero_rate():
 3. Aim for edge cases and error conditions
 4. Run tests: pytest
             """,
-            "security": """
+        "security": """
 To fix security issues:
 
 1. SQL Injection - use parameterized queries:
@@ -484,23 +518,83 @@ To fix security issues:
 3. Secure Defaults - use secure configurations
 4. Secrets - never hardcode passwords or API keys
             """,
-        }
+    }
+
+
+# Principle, topic, and quick fix tables are static, so they are built once at
+# import time and shared by every help system instance.
+_PRINCIPLES: Dict[str, ConstitutionalPrinciple] = _build_constitutional_principles()
+_HELP_TOPICS: Dict[str, HelpTopic] = _build_help_topics()
+_QUICK_FIXES: Dict[str, str] = _build_quick_fixes()
+
+# Search results shown before summarizing the remainder as a count.
+_MAX_SEARCH_RESULTS = 10
+
+# Search tokens are maximal runs of word characters.
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=1)
+def _get_text_wrapper() -> "textwrap.TextWrapper":
+    """Get the shared wrapper for principle prose, importing textwrap on first use."""
+    import textwrap
+
+    return textwrap.TextWrapper(width=70)
+
+
+def _iter_segment_hits(text: str, starts: List[int], needle: str) -> Iterator[int]:
+    """Yield, in order, the index of each segment of text (starting at starts) holding needle."""
+    offset = text.find(needle)
+    while offset != -1:
+        segment = bisect_right(starts, offset) - 1
+        yield segment
+        # Further hits inside the same segment add nothing, so skip past it
+        if segment + 1 == len(starts):
+            return
+        offset = text.find(needle, starts[segment + 1])
+
+
+class ConstitutionalHelpSystem:
+    """Main help system for constitutional compliance guidance."""
+
+    def __init__(self):
+        """Initialize the help system with constitutional principles."""
+        self.principles = _PRINCIPLES
+        self.help_topics = _HELP_TOPICS
+        self.quick_fixes = _QUICK_FIXES
+        self._rendered_help: Dict[str, str] = {}
 
     def show_help(self, topic: Optional[str] = None) -> str:
         """Show help for a specific topic or general help."""
         if not topic:
             return self._show_general_help()
 
-        if topic in self.principles:
-            return self._show_principle_help(topic)
+        # Help content is static, so each known topic is rendered only once
+        help_text = self._rendered_help.get(topic)
+        if help_text is not None:
+            return help_text
 
-        if topic in self.help_topics:
-            return self._show_topic_help(topic)
+        handler = self._dispatch.get(topic)
+        if handler is None:
+            return f"❌ Unknown help topic: {topic}\n\nAvailable topics: {', '.join(self.all_topics)}"
 
-        if topic in self.quick_fixes:
-            return self._show_quick_fix(topic)
+        help_text = handler()
+        self._rendered_help[topic] = help_text
+        return help_text
 
-        return f"❌ Unknown help topic: {topic}\\n\\nAvailable topics: {', '.join(self._get_all_topics())}"
+    @cached_property
+    def _dispatch(self) -> Dict[str, Callable[[], str]]:
+        """Map every help key to its renderer, resolved with one lookup."""
+        # Inserted lowest precedence first, so principles win over topics and
+        # topics over quick fixes if a key ever appears in more than one table
+        dispatch: Dict[str, Callable[[], str]] = {}
+        for key in self.quick_fixes:
+            dispatch[key] = partial(self._show_quick_fix, key)
+        for key in self.help_topics:
+            dispatch[key] = partial(self._show_topic_help, key)
+        for key in self.principles:
+            dispatch[key] = partial(self._show_principle_help, key)
+        return dispatch
 
     def _show_general_help(self) -> str:
         """Show general help overview."""
@@ -551,46 +645,46 @@ For more help: constitutional-help getting-started
         """Show detailed help for a constitutional principle."""
         principle = self.principles[principle_key]
 
-        help_text = f"""
-🏛️ {principle.name} ({principle.short_name})
+        violations = "\n".join(
+            f"  • {violation}" for violation in principle.common_violations
+        )
+        fixes = "\n".join(f"  • {fix}" for fix in principle.how_to_fix)
+        wrapper = _get_text_wrapper()
 
-📖 DESCRIPTION:
-{textwrap.fill(principle.description, width=70)}
+        code_examples = dict(principle.examples)
+        examples = ""
+        if code_examples.get("good") or code_examples.get("bad"):
+            examples = f"""
+💡 EXAMPLES:
 
-🎯 WHY IT'S IMPORTANT:
-{textwrap.fill(principle.why_important, width=70)}
+✅ Good Example:
+{code_examples.get('good', 'No example available')}
 
-❌ COMMON VIOLATIONS:
+❌ Bad Example:
+{code_examples.get('bad', 'No example available')}
 """
-        for violation in principle.common_violations:
-            help_text += f"  • {violation}\\n"
 
-        help_text += f"""
-✅ HOW TO FIX:
-"""
-        for fix in principle.how_to_fix:
-            help_text += f"  • {fix}\\n"
+        return f"""
+🏛️ {principle.name} ({principle.short_name})
 
-        if principle.examples.get("good") or principle.examples.get("bad"):
-            help_text += f"""
-💡 EXAMPLES:
+📖 DESCRIPTION:
+{wrapper.fill(principle.description)}
 
-✅ Good Example:
-{principle.examples.get('good', 'No example available')}
+🎯 WHY IT'S IMPORTANT:
+{wrapper.fill(principle.why_important)}
 
-❌ Bad Example:
-{principle.examples.get('bad', 'No example available')}
-"""
+❌ COMMON VIOLATIONS:
+{violations}
 
-        help_text += f"""
+✅ HOW TO FIX:
+{fixes}
+{examples}
 🔧 ENFORCEMENT TOOLS:
 {', '.join(principle.tools)}
 
 💡 TIP: Run 'constitutional-help violations' for common fixes
         """
 
-        return help_text
-
     def _show_topic_help(self, topic_key: str) -> str:
         """Show help for a specific topic."""
         topic = self.help_topics[topic_key]
@@ -627,69 +721,135 @@ For more help: constitutional-help getting-started
 💡 Need more help? Try: constitutional-help violations
         """
 
-    def _get_all_topics(self) -> List[str]:
-        """Get list of all available help topics."""
-        topics = list(self.help_topics.keys())
-        topics.extend(self.principles.keys())
-        topics.extend(self.quick_fixes.keys())
-        return sorted(topics)
+    @cached_property
+    def all_topics(self) -> Tuple[str, ...]:
+        """Sorted names of all available help topics."""
+        return tuple(
+            sorted(chain(self.help_topics, self.principles, self.quick_fixes))
+        )
 
     def list_principles(self) -> str:
         """List all constitutional principles with brief descriptions."""
-        output = "🏛️ Constitutional Principles:\\n\\n"
+        return self._principle_listing
+
+    @cached_property
+    def _principle_listing(self) -> str:
+        """Rendered principle listing, built on first use."""
+        listing = "\n".join(
+            f"  {principle.short_name:15} - {principle.description}"
+            for principle in self.principles.values()
+        )
+        return (
+            f"🏛️ Constitutional Principles:\n\n{listing}\n\n"
+            "💡 Use 'constitutional-help <principle>' for detailed guidance"
+        )
+
+    @cached_property
+    def _search_entries(self) -> List[Tuple[str, str]]:
+        """Searchable entries in display order as (result line, lowercased text)."""
+        entries = []
 
         for key, principle in self.principles.items():
-            output += f"  {principle.short_name:15} - {principle.description}\\n"
+            fields = [principle.name, principle.description]
+            fields.extend(principle.common_violations)
+            entries.append((f"principle:{key} - {principle.name}", fields))
 
-        output += "\\n💡 Use 'constitutional-help <principle>' for detailed guidance"
-        return output
+        for key, topic in self.help_topics.items():
+            fields = [topic.topic, topic.summary, topic.detailed_help]
+            entries.append((f"topic:{key} - {topic.topic}", fields))
+
+        for key, fix_content in self.quick_fixes.items():
+            entries.append((f"fix:{key} - Quick fix for {key}", [fix_content]))
+
+        # Fields are joined with NUL so a query can never match across two fields
+        return [
+            (label, "\0".join(fields).lower()) for label, fields in entries
+        ]
+
+    @cached_property
+    def _search_index(self) -> Dict[str, Set[int]]:
+        """Inverted index mapping each lowercased token to entry positions."""
+        index: Dict[str, Set[int]] = defaultdict(set)
+        for position, (_, text) in enumerate(self._search_entries):
+            for token in _TOKEN_PATTERN.findall(text):
+                index[token].add(position)
+        return dict(index)
+
+    @cached_property
+    def _search_vocabulary(self) -> Tuple[str, List[int], List[Set[int]]]:
+        """NUL-joined index tokens with each token's start offset and postings."""
+        starts: List[int] = []
+        postings: List[Set[int]] = []
+        offset = 0
+        for token, token_positions in self._search_index.items():
+            starts.append(offset)
+            postings.append(token_positions)
+            offset += len(token) + 1
+        return "\0".join(self._search_index), starts, postings
+
+    @cached_property
+    def _search_corpus(self) -> Tuple[str, List[int]]:
+        """NUL-joined entry search text with each entry's start offset."""
+        starts: List[int] = []
+        offset = 0
+        for _, text in self._search_entries:
+            starts.append(offset)
+            offset += len(text) + 1
+        return "\0".join(text for _, text in self._search_entries), starts
 
     def search_help(self, query: str) -> str:
         """Search help content for a query."""
-        results = []
         query_lower = query.lower()
 
-        # Search principles
-        for key, principle in self.principles.items():
-            if (
-                query_lower in principle.name.lower()
-                or query_lower in principle.description.lower()
-                or any(
-                    query_lower in violation.lower()
-                    for violation in principle.common_violations
-                )
-            ):
-                results.append(f"principle:{key} - {principle.name}")
-
-        # Search topics
-        for key, topic in self.help_topics.items():
-            if (
-                query_lower in topic.topic.lower()
-                or query_lower in topic.summary.lower()
-                or query_lower in topic.detailed_help.lower()
-            ):
-                results.append(f"topic:{key} - {topic.topic}")
-
-        # Search quick fixes
-        for key, fix_content in self.quick_fixes.items():
-            if query_lower in fix_content.lower():
-                results.append(f"fix:{key} - Quick fix for {key}")
+        results: List[str] = []
+        if _TOKEN_PATTERN.fullmatch(query_lower):
+            # A single-word query can only match inside one token, so scanning
+            # the (deduplicated) vocabulary finds the same hits as the full text
+            vocabulary, starts, postings = self._search_vocabulary
+            positions: Set[int] = set()
+            for token_number in _iter_segment_hits(vocabulary, starts, query_lower):
+                positions.update(postings[token_number])
+            total_hits = len(positions)
+            results = [
+                self._search_entries[i][0]
+                for i in heapq.nsmallest(_MAX_SEARCH_RESULTS, positions)
+            ]
+        else:
+            # Other queries scan the whole corpus in one pass of str.find
+            corpus, starts = self._search_corpus
+            total_hits = 0
+            for position in _iter_segment_hits(corpus, starts, query_lower):
+                total_hits += 1
+                if len(results) < _MAX_SEARCH_RESULTS:
+                    results.append(self._search_entries[position][0])
 
         if not results:
-            return f"❌ No help found for '{query}'\\n\\nTry: constitutional-help principles"
+            return f"❌ No help found for '{query}'\n\nTry: constitutional-help principles"
 
-        output = f"🔍 Search results for '{query}':\\n\\n"
-        for result in results[:10]:  # Limit to top 10 results
-            output += f"  • {result}\\n"
+        matches = "\n".join(f"  • {result}" for result in results)
+        output = f"🔍 Search results for '{query}':\n\n{matches}\n"
 
-        if len(results) > 10:
-            output += f"  ... and {len(results) - 10} more results\\n"
+        if total_hits > _MAX_SEARCH_RESULTS:
+            output += f"  ... and {total_hits - _MAX_SEARCH_RESULTS} more results\n"
 
         return output
 
 
+@lru_cache(maxsize=1)
+def get_help_system() -> ConstitutionalHelpSystem:
+    """Get the shared help system, so its render and search caches are reused."""
+    return ConstitutionalHelpSystem()
+
+
 def main():
     """Main CLI interface for the constitutional help system."""
+    # Fast path: a lone topic argument needs no argument parser
+    if len(sys.argv) == 2 and not sys.argv[1].startswith("-"):
+        print(get_help_system().show_help(sys.argv[1]))
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="project Constitutional Help System",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -719,7 +879,7 @@ Examples:
 
     args = parser.parse_args()
 
-    help_system = ConstitutionalHelpSystem()
+    help_system = get_help_system()
 
     if args.list_principles:
         print(help_system.list_principles())
@@ -9,15 +9,32 @@ Part of project's SDD Constitutional Foundation & Enforcement system.
 """
 
 import os
+import re
 import sys
 import asyncio
+import bisect
+import copy
+import itertools
 import json
+import math
+import operator
 import time
 import psutil
 import threading
-from datetime import datetime, timedelta
+import weakref
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable, Union, NamedTuple
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Any,
+    Callable,
+    Iterable,
+    Tuple,
+    Union,
+    NamedTuple,
+)
 from dataclasses import dataclass, field, asdict
 from collections import deque, defaultdict
 from contextlib import contextmanager
@@ -25,6 +42,28 @@ from enum import Enum
 import logging
 import statistics
 
+try:
+    # orjson encodes several times faster than the stdlib json module
+    import orjson
+
+    def _dump_json(data: Any, indent: bool = False) -> bytes:
+        """Serialize data to UTF-8 JSON, indented by two spaces if requested."""
+        return orjson.dumps(
+            data, default=str, option=orjson.OPT_INDENT_2 if indent else 0
+        )
+
+except ImportError:
+    # json.dumps builds a new encoder per call when given options; these are
+    # stateless between calls, so one of each is shared by every caller
+    _JSON_ENCODER = json.JSONEncoder(default=str)
+    _JSON_INDENT_ENCODER = json.JSONEncoder(default=str, indent=2)
+
+    def _dump_json(data: Any, indent: bool = False) -> bytes:
+        """Serialize data to UTF-8 JSON, indented by two spaces if requested."""
+        encoder = _JSON_INDENT_ENCODER if indent else _JSON_ENCODER
+        return encoder.encode(data).encode("utf-8")
+
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -48,12 +87,61 @@ class AlertSeverity(Enum):
     CRITICAL = "critical"
 
 
+# Prometheus exposition types, and the escapes its HELP text requires
+_PROMETHEUS_TYPES: Dict[MetricType, str] = {
+    MetricType.COUNTER: "counter",
+    MetricType.GAUGE: "gauge",
+    MetricType.HISTOGRAM: "histogram",
+    MetricType.TIMER: "histogram",
+}
+_PROMETHEUS_HELP_ESCAPES = str.maketrans({"\\": "\\\\", "\n": "\\n"})
+
+# Log prefixes for triggered alerts
+_SEVERITY_EMOJI: Dict[AlertSeverity, str] = {
+    AlertSeverity.INFO: "ℹ️",
+    AlertSeverity.WARNING: "⚠️",
+    AlertSeverity.ERROR: "❌",
+    AlertSeverity.CRITICAL: "🚨",
+}
+
+# Comparison operators allowed in alert conditions
+_ALERT_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+# An alert condition: a comparison operator and a numeric threshold
+_ALERT_CONDITION_PATTERN = re.compile(
+    r"\s*(<=|>=|==|!=|<|>)\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*"
+)
+
+
+def _format_utc(epoch_seconds: float) -> str:
+    """Format seconds since the epoch as an ISO 8601 UTC timestamp."""
+    moment = datetime.fromtimestamp(epoch_seconds, timezone.utc)
+    return moment.replace(tzinfo=None).isoformat() + "Z"
+
+
+class RecommendationRule(NamedTuple):
+    """Threshold check that produces a report recommendation."""
+
+    metric_name: str
+    compare: Callable[[Any, Any], bool]
+    threshold: Union[int, float]
+    template: str  # Formatted with the checked value as ``value``
+    window: int = 0  # Mean of this many recent values; 0 for the current value
+
+
 class MetricValue(NamedTuple):
     """Metric value with metadata."""
 
     value: Union[int, float]
-    timestamp: datetime
-    labels: Dict[str, str] = {}
+    timestamp: float  # Seconds since the epoch
+    labels: Optional[Dict[str, str]] = None  # None for unlabeled samples
 
 
 @dataclass
@@ -65,24 +153,56 @@ class Metric:
     metric_type: MetricType
     unit: str = ""
     labels: Dict[str, str] = field(default_factory=dict)
-    values: deque = field(default_factory=lambda: deque(maxlen=1000))
+    capacity: int = 1000  # Most recent samples kept
+    values: deque = field(init=False)
+
+    def __post_init__(self):
+        self.values = deque(maxlen=self.capacity)
 
     def add_value(self, value: Union[int, float], labels: Dict[str, str] = None):
         """Add a value to the metric."""
         metric_value = MetricValue(
-            value=value, timestamp=datetime.utcnow(), labels=labels or {}
+            value=value, timestamp=time.time(), labels=labels or None
         )
         self.values.append(metric_value)
 
+    def extend(
+        self,
+        values: Iterable[Union[int, float]],
+        timestamps: Optional[Iterable[float]] = None,
+        labels: Dict[str, str] = None,
+    ):
+        """Add several values, oldest first, in one call.
+
+        Timestamps default to the current time and must be in time order.
+        """
+        labels = labels or None
+        if timestamps is None:
+            timestamps = itertools.repeat(time.time())
+        self.values.extend(
+            MetricValue(value=value, timestamp=timestamp, labels=labels)
+            for value, timestamp in zip(values, timestamps)
+        )
+
     def get_current_value(self) -> Optional[Union[int, float]]:
         """Get the most recent value."""
         if self.values:
             return self.values[-1].value
         return None
 
-    def get_values_since(self, since: datetime) -> List[MetricValue]:
-        """Get values since a specific timestamp."""
-        return [v for v in self.values if v.timestamp >= since]
+    def get_values_since(self, since: float) -> List[MetricValue]:
+        """Get values since a specific time, in seconds since the epoch."""
+        # Values are appended in time order, so the cutoff is a binary search
+        start = bisect.bisect_left(
+            self.values, since, key=operator.attrgetter("timestamp")
+        )
+        return list(itertools.islice(self.values, start, None))
+
+    def get_recent_values(self, count: int) -> List[MetricValue]:
+        """Get the most recent ``count`` values, oldest first."""
+        # Deques cannot be sliced; islice skips to the tail in C
+        start = max(len(self.values) - count, 0)
+        return list(itertools.islice(self.values, start, None))
 
 
 @dataclass
@@ -96,7 +216,22 @@ class Alert:
     severity: AlertSeverity
     enabled: bool = True
     cooldown_minutes: int = 5
-    last_triggered: Optional[datetime] = None
+    last_triggered: Optional[float] = None  # Seconds since the epoch
+    _compare: Callable[[Any, Any], bool] = field(
+        init=False, repr=False, compare=False
+    )
+    _threshold: float = field(init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any):
+        if name == "condition":
+            # Parse on every assignment, before storing it, so checks always
+            # evaluate the current condition by calling the C comparison
+            match = _ALERT_CONDITION_PATTERN.fullmatch(value)
+            if match is None:
+                raise ValueError(f"Invalid alert condition: '{value}'")
+            super().__setattr__("_compare", _ALERT_OPERATORS[match.group(1)])
+            super().__setattr__("_threshold", float(match.group(2)))
+        super().__setattr__(name, value)
 
     def should_trigger(self, metric_value: Union[int, float]) -> bool:
         """Check if alert should trigger."""
@@ -104,17 +239,17 @@ class Alert:
             return False
 
         # Check cooldown
-        if self.last_triggered:
-            cooldown_period = timedelta(minutes=self.cooldown_minutes)
-            if datetime.utcnow() - self.last_triggered < cooldown_period:
+        if self.last_triggered is not None:
+            if time.time() - self.last_triggered < self.cooldown_minutes * 60:
                 return False
 
         # Evaluate condition
         try:
-            condition_met = eval(f"{metric_value} {self.condition}")
-            return condition_met
-        except Exception as e:
-            logger.error(f"Error evaluating alert condition '{self.condition}': {e}")
+            return self._compare(metric_value, self._threshold)
+        except TypeError as e:
+            logger.error(
+                "Error evaluating alert condition '%s': %s", self.condition, e
+            )
             return False
 
 
@@ -132,6 +267,50 @@ class Dashboard:
 class ConstitutionalMetricsCollector:
     """Main metrics collection and monitoring system."""
 
+    # Metrics summarized in every report
+    _KEY_METRICS = (
+        "constitutional_compliance_score",
+        "quality_gates_pass_rate",
+        "code_coverage_percentage",
+        "security_vulnerabilities_total",
+        "constitutional_violations_total",
+    )
+
+    # Report recommendations, in the order they are listed
+    _RECOMMENDATION_RULES = (
+        RecommendationRule(
+            "code_coverage_percentage",
+            operator.lt,
+            80,
+            "Code coverage is {value:.1f}%. Consider adding more tests to reach 80% threshold.",
+        ),
+        RecommendationRule(
+            "security_vulnerabilities_critical",
+            operator.gt,
+            0,
+            "Address {value} critical security vulnerabilities immediately.",
+        ),
+        RecommendationRule(
+            "quality_gate_execution_time",
+            operator.gt,
+            1.0,
+            "Quality gate execution time is high. Consider optimizing validation processes.",
+            window=10,
+        ),
+        RecommendationRule(
+            "constitutional_violations_total",
+            operator.gt,
+            5,
+            "High number of constitutional violations ({value}). Review code for SRP and maintainability issues.",
+        ),
+        RecommendationRule(
+            "memory_usage_mb",
+            operator.gt,
+            500,
+            "High memory usage ({value:.1f}MB). Monitor for memory leaks.",
+        ),
+    )
+
     def __init__(self, storage_dir: Optional[Path] = None):
         """Initialize metrics collection system."""
         self.storage_dir = storage_dir or Path(__file__).parent.parent / "metrics"
@@ -139,11 +318,31 @@ class ConstitutionalMetricsCollector:
 
         self.metrics: Dict[str, Metric] = {}
         self.alerts: Dict[str, Alert] = {}
+        # Alerts by the metric they watch, so a write only checks its own
+        self._alerts_by_metric: Dict[str, List[Alert]] = defaultdict(list)
         self.dashboards: Dict[str, Dashboard] = {}
 
         self.collection_interval = 10  # seconds
         self.collection_active = False
         self.collection_thread: Optional[threading.Thread] = None
+        # Set to wake the collection loop from its wait between ticks
+        self._stop_event = threading.Event()
+        # Rendered Prometheus block per metric, with the sample it shows
+        self._prometheus_blocks: Dict[str, Tuple[MetricValue, str]] = {}
+
+        # Dashboard payloads built each collection tick, served while collecting
+        self._dashboard_cache: Dict[str, Dict[str, Any]] = {}
+
+        # Alerts log, opened on the first alert and kept open until close()
+        self._alerts_file = None
+        self._alerts_lock = threading.Lock()
+
+        # Snapshot history, one JSON object per line, opened like the alerts log
+        self._snapshots_file = None
+        self._snapshots_lock = threading.Lock()
+
+        # Lowercased process names by pid, carried over between collections
+        self._process_names: Dict[int, str] = {}
 
         # Initialize built-in metrics and alerts
         self._initialize_constitutional_metrics()
@@ -592,18 +791,20 @@ class ConstitutionalMetricsCollector:
         metric_type: MetricType,
         unit: str = "",
         labels: Dict[str, str] = None,
+        capacity: int = 1000,
     ) -> Metric:
-        """Register a new metric."""
+        """Register a new metric, keeping up to ``capacity`` recent samples."""
         metric = Metric(
             name=name,
             description=description,
             metric_type=metric_type,
             unit=unit,
             labels=labels or {},
+            capacity=capacity,
         )
 
         self.metrics[name] = metric
-        logger.info(f"📊 Registered metric: {name}")
+        logger.info("📊 Registered metric: %s", name)
 
         return metric
 
@@ -626,8 +827,13 @@ class ConstitutionalMetricsCollector:
             cooldown_minutes=cooldown_minutes,
         )
 
+        replaced = self.alerts.get(name)
+        if replaced is not None:
+            self._alerts_by_metric[replaced.metric_name].remove(replaced)
+
         self.alerts[name] = alert
-        logger.info(f"🚨 Registered alert: {name}")
+        self._alerts_by_metric[metric_name].append(alert)
+        logger.info("🚨 Registered alert: %s", name)
 
         return alert
 
@@ -635,47 +841,72 @@ class ConstitutionalMetricsCollector:
         self, name: str, value: Union[int, float], labels: Dict[str, str] = None
     ):
         """Record a metric value."""
-        if name not in self.metrics:
-            logger.warning(f"Metric '{name}' not registered")
+        metric = self.metrics.get(name)
+        if metric is None:
+            logger.warning("Metric '%s' not registered", name)
             return
 
-        metric = self.metrics[name]
         metric.add_value(value, labels)
 
         # Check alerts for this metric
         self._check_alerts_for_metric(name, value)
 
+    def record_many(
+        self,
+        name: str,
+        values: Iterable[Union[int, float]],
+        timestamps: Optional[Iterable[float]] = None,
+        labels: Dict[str, str] = None,
+    ):
+        """Record several values for a metric, oldest first.
+
+        Alerts are checked once, against the newest value.
+        """
+        metric = self.metrics.get(name)
+        if metric is None:
+            logger.warning("Metric '%s' not registered", name)
+            return
+
+        metric.extend(values, timestamps, labels)
+
+        current_value = metric.get_current_value()
+        if current_value is not None:
+            self._check_alerts_for_metric(name, current_value)
+
     def increment_counter(
         self, name: str, amount: Union[int, float] = 1, labels: Dict[str, str] = None
     ):
         """Increment a counter metric."""
-        if name not in self.metrics:
-            logger.warning(f"Counter metric '{name}' not registered")
+        metric = self.metrics.get(name)
+        if metric is None:
+            logger.warning("Counter metric '%s' not registered", name)
             return
 
-        metric = self.metrics[name]
-        if metric.metric_type != MetricType.COUNTER:
-            logger.warning(f"Metric '{name}' is not a counter")
+        if metric.metric_type is not MetricType.COUNTER:
+            logger.warning("Metric '%s' is not a counter", name)
             return
 
-        current = metric.get_current_value() or 0
-        new_value = current + amount
-        self.record_metric(name, new_value, labels)
+        # Record directly rather than through record_metric's second lookup
+        new_value = (metric.get_current_value() or 0) + amount
+        metric.add_value(new_value, labels)
+        self._check_alerts_for_metric(name, new_value)
 
     def set_gauge(
         self, name: str, value: Union[int, float], labels: Dict[str, str] = None
     ):
         """Set a gauge metric value."""
-        if name not in self.metrics:
-            logger.warning(f"Gauge metric '{name}' not registered")
+        metric = self.metrics.get(name)
+        if metric is None:
+            logger.warning("Gauge metric '%s' not registered", name)
             return
 
-        metric = self.metrics[name]
-        if metric.metric_type != MetricType.GAUGE:
-            logger.warning(f"Metric '{name}' is not a gauge")
+        if metric.metric_type is not MetricType.GAUGE:
+            logger.warning("Metric '%s' is not a gauge", name)
             return
 
-        self.record_metric(name, value, labels)
+        # Record directly rather than through record_metric's second lookup
+        metric.add_value(value, labels)
+        self._check_alerts_for_metric(name, value)
 
     @contextmanager
     def timer_metric(self, name: str, labels: Dict[str, str] = None):
@@ -689,14 +920,13 @@ class ConstitutionalMetricsCollector:
 
     def _check_alerts_for_metric(self, metric_name: str, value: Union[int, float]):
         """Check alerts for a specific metric."""
-        for alert_name, alert in self.alerts.items():
-            if alert.metric_name == metric_name:
-                if alert.should_trigger(value):
-                    self._trigger_alert(alert, value)
+        for alert in self._alerts_by_metric.get(metric_name, ()):
+            if alert.should_trigger(value):
+                self._trigger_alert(alert, value)
 
     def _trigger_alert(self, alert: Alert, value: Union[int, float]):
         """Trigger an alert."""
-        alert.last_triggered = datetime.utcnow()
+        alert.last_triggered = time.time()
 
         alert_data = {
             "alert_name": alert.name,
@@ -705,20 +935,16 @@ class ConstitutionalMetricsCollector:
             "current_value": value,
             "condition": alert.condition,
             "severity": alert.severity.value,
-            "timestamp": alert.last_triggered.isoformat() + "Z",
+            "timestamp": _format_utc(alert.last_triggered),
         }
 
         # Log the alert
-        severity_emoji = {
-            AlertSeverity.INFO: "ℹ️",
-            AlertSeverity.WARNING: "⚠️",
-            AlertSeverity.ERROR: "❌",
-            AlertSeverity.CRITICAL: "🚨",
-        }
-
-        emoji = severity_emoji.get(alert.severity, "🔔")
         logger.warning(
-            f"{emoji} ALERT: {alert.name} - {alert.description} (Value: {value})"
+            "%s ALERT: %s - %s (Value: %s)",
+            _SEVERITY_EMOJI.get(alert.severity, "🔔"),
+            alert.name,
+            alert.description,
+            value,
         )
 
         # Save alert to file
@@ -729,15 +955,40 @@ class ConstitutionalMetricsCollector:
 
     def _save_alert(self, alert_data: Dict[str, Any]):
         """Save alert to file."""
-        alerts_file = self.storage_dir / "alerts.jsonl"
-
-        with open(alerts_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(alert_data) + "\n")
+        with self._alerts_lock:
+            if self._alerts_file is None:
+                self._alerts_file = open(self.storage_dir / "alerts.jsonl", "ab")
+                weakref.finalize(self, self._alerts_file.close)
+            self._alerts_file.write(_dump_json(alert_data) + b"\n")
+            # Each alert reaches the file as it is written
+            self._alerts_file.flush()
+
+    def _append_snapshot(self, payload: bytes) -> Path:
+        """Append one encoded snapshot to the snapshot history."""
+        snapshot_path = self.storage_dir / "metrics_snapshots.jsonl"
+        with self._snapshots_lock:
+            if self._snapshots_file is None:
+                self._snapshots_file = open(snapshot_path, "ab")
+                weakref.finalize(self, self._snapshots_file.close)
+            self._snapshots_file.write(payload + b"\n")
+            self._snapshots_file.flush()
+        return snapshot_path
+
+    def close(self):
+        """Close the alerts and snapshot logs; a later write reopens them."""
+        with self._alerts_lock:
+            if self._alerts_file is not None:
+                self._alerts_file.close()
+                self._alerts_file = None
+        with self._snapshots_lock:
+            if self._snapshots_file is not None:
+                self._snapshots_file.close()
+                self._snapshots_file = None
 
     def _send_alert_notification(self, alert_data: Dict[str, Any]):
         """Send alert notification (mock implementation)."""
         # In a real system, this would integrate with notification systems
-        logger.info(f"📢 Alert notification sent: {alert_data['alert_name']}")
+        logger.info("📢 Alert notification sent: %s", alert_data["alert_name"])
 
     def start_collection(self):
         """Start automatic metrics collection."""
@@ -746,13 +997,14 @@ class ConstitutionalMetricsCollector:
             return
 
         self.collection_active = True
+        self._stop_event.clear()
         self.collection_thread = threading.Thread(
             target=self._collection_loop, daemon=True
         )
         self.collection_thread.start()
 
         logger.info(
-            f"📊 Started metrics collection (interval: {self.collection_interval}s)"
+            "📊 Started metrics collection (interval: %ss)", self.collection_interval
         )
 
     def stop_collection(self):
@@ -762,25 +1014,28 @@ class ConstitutionalMetricsCollector:
             return
 
         self.collection_active = False
+        self._stop_event.set()
 
         if self.collection_thread:
             self.collection_thread.join(timeout=5)
+        self._dashboard_cache = {}
 
         logger.info("📊 Stopped metrics collection")
 
     def _collection_loop(self):
         """Main metrics collection loop."""
-        while self.collection_active:
+        while not self._stop_event.is_set():
             try:
                 self._collect_system_metrics()
                 self._collect_performance_metrics()
                 self._calculate_derived_metrics()
-
-                time.sleep(self.collection_interval)
+                self._refresh_dashboard_cache()
 
             except Exception as e:
-                logger.error(f"Error in metrics collection: {e}")
-                time.sleep(self.collection_interval)
+                logger.error("Error in metrics collection: %s", e)
+
+            # Returns as soon as stop_collection() sets the event
+            self._stop_event.wait(self.collection_interval)
 
     def _collect_system_metrics(self):
         """Collect system-level metrics."""
@@ -803,26 +1058,39 @@ class ConstitutionalMetricsCollector:
             self.set_gauge("disk_free_gb", disk_free_gb)
 
             # Process count (mock - in real system would count actual processes)
-            process_count = len(
-                [
-                    p
-                    for p in psutil.process_iter()
-                    if "constitutional" in p.name().lower()
-                ]
+            process_count = sum(
+                1
+                for name in self._refresh_process_names().values()
+                if "constitutional" in name
             )
             self.set_gauge(
                 "active_processes", max(process_count, 1)
             )  # At least 1 (this process)
 
         except Exception as e:
-            logger.error(f"Error collecting system metrics: {e}")
+            logger.error("Error collecting system metrics: %s", e)
+
+    def _refresh_process_names(self) -> Dict[int, str]:
+        """Update the process name cache, looking up only pids not seen before."""
+        names = {}
+        for pid in psutil.pids():
+            name = self._process_names.get(pid)
+            if name is None:
+                try:
+                    name = psutil.Process(pid).name().lower()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            names[pid] = name
+
+        # Exited processes drop out because only live pids are carried over
+        self._process_names = names
+        return names
 
     def _collect_performance_metrics(self):
         """Collect performance metrics."""
         try:
             # Calculate validations per minute based on recent activity
-            now = datetime.utcnow()
-            minute_ago = now - timedelta(minutes=1)
+            minute_ago = time.time() - 60
 
             # Count recent quality gate runs
             qg_metric = self.metrics.get("quality_gates_total_runs")
@@ -841,16 +1109,14 @@ class ConstitutionalMetricsCollector:
             self.set_gauge("files_processed_per_second", files_per_second)
 
         except Exception as e:
-            logger.error(f"Error collecting performance metrics: {e}")
+            logger.error("Error collecting performance metrics: %s", e)
 
     def _calculate_derived_metrics(self):
         """Calculate derived metrics from base metrics."""
         try:
             # Calculate quality gates pass rate
-            total_runs = (
-                self.metrics["quality_gates_total_runs"].get_current_value() or 0
-            )
-            passed_runs = self.metrics["quality_gates_passed"].get_current_value() or 0
+            total_runs = self._cv("quality_gates_total_runs")
+            passed_runs = self._cv("quality_gates_passed")
 
             if total_runs > 0:
                 pass_rate = (passed_runs / total_runs) * 100
@@ -858,20 +1124,16 @@ class ConstitutionalMetricsCollector:
 
             # Calculate constitutional compliance score
             # This is a composite score based on various factors
-            coverage = self.metrics["code_coverage_percentage"].get_current_value() or 0
-            violations = (
-                self.metrics["constitutional_violations_total"].get_current_value() or 0
-            )
-            security_issues = (
-                self.metrics["security_vulnerabilities_total"].get_current_value() or 0
-            )
+            coverage = self._cv("code_coverage_percentage")
+            violations = self._cv("constitutional_violations_total")
+            security_issues = self._cv("security_vulnerabilities_total")
 
             # Simple scoring algorithm (can be made more sophisticated)
             score = max(0, min(100, coverage - violations - (security_issues * 5)))
             self.set_gauge("constitutional_compliance_score", score)
 
         except Exception as e:
-            logger.error(f"Error calculating derived metrics: {e}")
+            logger.error("Error calculating derived metrics: %s", e)
 
     def get_metric_summary(self, name: str) -> Dict[str, Any]:
         """Get summary statistics for a metric."""
@@ -890,6 +1152,8 @@ class ConstitutionalMetricsCollector:
                 "count": 0,
             }
 
+        # fmean's float accumulation is far faster than mean's exact one
+        mean = statistics.fmean(values)
         summary = {
             "name": name,
             "description": metric.description,
@@ -899,29 +1163,58 @@ class ConstitutionalMetricsCollector:
             "current": values[-1],
             "min": min(values),
             "max": max(values),
-            "mean": statistics.mean(values),
+            "mean": mean,
         }
 
         if len(values) > 1:
             summary["median"] = statistics.median(values)
-            summary["stdev"] = statistics.stdev(values)
+            # Sample standard deviation in floats around the mean above;
+            # statistics.stdev recomputes the mean with exact fractions
+            squared_deviations = math.fsum([(v - mean) ** 2 for v in values])
+            summary["stdev"] = math.sqrt(squared_deviations / (len(values) - 1))
 
         return summary
 
     def get_dashboard_data(self, dashboard_name: str) -> Dict[str, Any]:
-        """Get data for a specific dashboard."""
+        """Get data for a specific dashboard.
+
+        While collection is running this is a copy of the payload built on the
+        latest collection tick; otherwise it is built now.
+        """
         if dashboard_name not in self.dashboards:
             return {}
 
-        dashboard = self.dashboards[dashboard_name]
+        if self.collection_active:
+            cached = self._dashboard_cache.get(dashboard_name)
+            if cached is not None:
+                # Callers get their own copy, nested containers included, so
+                # they cannot alter the cache other callers read
+                return copy.deepcopy(cached)
+
+        return self._build_dashboard_data(self.dashboards[dashboard_name])
+
+    def _refresh_dashboard_cache(self):
+        """Rebuild every dashboard's payload from the current metric values."""
+        timestamp = _format_utc(time.time())
+        self._dashboard_cache = {
+            name: self._build_dashboard_data(dashboard, timestamp)
+            for name, dashboard in self.dashboards.items()
+        }
+
+    def _build_dashboard_data(
+        self, dashboard: Dashboard, timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build a dashboard's payload from the current metric values.
 
+        ``timestamp`` stamps the payload; it defaults to the current time.
+        """
         dashboard_data = {
             "name": dashboard.name,
             "description": dashboard.description,
             "refresh_interval": dashboard.refresh_interval,
-            "last_updated": datetime.utcnow().isoformat() + "Z",
+            "last_updated": timestamp or _format_utc(time.time()),
             "metrics": {},
-            "charts": dashboard.charts,
+            "charts": copy.deepcopy(dashboard.charts),
         }
 
         # Get current values for all metrics
@@ -936,10 +1229,13 @@ class ConstitutionalMetricsCollector:
 
         return dashboard_data
 
-    def get_all_metrics_data(self) -> Dict[str, Any]:
-        """Get data for all metrics."""
+    def get_all_metrics_data(self, timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """Get data for all metrics.
+
+        ``timestamp`` stamps the data; it defaults to the current time.
+        """
         return {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": timestamp or _format_utc(time.time()),
             "metrics": {name: self.get_metric_summary(name) for name in self.metrics},
         }
 
@@ -947,12 +1243,17 @@ class ConstitutionalMetricsCollector:
         """Get currently active alerts."""
         active_alerts = []
 
-        for alert_name, alert in self.alerts.items():
-            if alert.enabled and alert.metric_name in self.metrics:
-                metric = self.metrics[alert.metric_name]
-                current_value = metric.get_current_value()
+        # Metric-major, so each metric's current value is read once
+        for metric_name, alerts in self._alerts_by_metric.items():
+            metric = self.metrics.get(metric_name)
+            if metric is None:
+                continue
+            current_value = metric.get_current_value()
+            if current_value is None:
+                continue
 
-                if current_value is not None and alert.should_trigger(current_value):
+            for alert in alerts:
+                if alert.should_trigger(current_value):
                     active_alerts.append(
                         {
                             "name": alert.name,
@@ -962,8 +1263,8 @@ class ConstitutionalMetricsCollector:
                             "condition": alert.condition,
                             "severity": alert.severity.value,
                             "last_triggered": (
-                                alert.last_triggered.isoformat() + "Z"
-                                if alert.last_triggered
+                                _format_utc(alert.last_triggered)
+                                if alert.last_triggered is not None
                                 else None
                             ),
                         }
@@ -973,79 +1274,105 @@ class ConstitutionalMetricsCollector:
 
     async def export_metrics(self, format: str = "json") -> str:
         """Export metrics in specified format."""
-        all_data = self.get_all_metrics_data()
+        if format.lower() == "prometheus":
+            return self._export_prometheus_format()
+        return (await self.export_metrics_bytes(format)).decode("utf-8")
 
+    async def export_metrics_bytes(self, format: str = "json") -> bytes:
+        """Export metrics in specified format as UTF-8 bytes, for writers
+        that send bytes and would otherwise re-encode the string."""
         if format.lower() == "json":
-            return json.dumps(all_data, indent=2)
+            return _dump_json(self.get_all_metrics_data(), indent=True)
         elif format.lower() == "prometheus":
-            return self._export_prometheus_format()
+            return self._export_prometheus_format().encode("utf-8")
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
     def _export_prometheus_format(self) -> str:
         """Export metrics in Prometheus format."""
-        prometheus_lines = []
+        prometheus_blocks = []
 
         for name, metric in self.metrics.items():
-            current_value = metric.get_current_value()
-            if current_value is not None:
-                # Add help line
-                prometheus_lines.append(f"# HELP {name} {metric.description}")
-
-                # Add type line
-                prom_type = {
-                    MetricType.COUNTER: "counter",
-                    MetricType.GAUGE: "gauge",
-                    MetricType.HISTOGRAM: "histogram",
-                    MetricType.TIMER: "histogram",
-                }.get(metric.metric_type, "gauge")
-
-                prometheus_lines.append(f"# TYPE {name} {prom_type}")
+            if not metric.values:
+                continue
+
+            # Re-render only metrics with a new sample since the last export
+            latest = metric.values[-1]
+            cached = self._prometheus_blocks.get(name)
+            if cached is not None and cached[0] is latest:
+                prometheus_blocks.append(cached[1])
+                continue
+
+            # HELP, TYPE and value lines for the metric
+            help_text = metric.description.translate(_PROMETHEUS_HELP_ESCAPES)
+            prom_type = _PROMETHEUS_TYPES.get(metric.metric_type, "gauge")
+            block = (
+                f"# HELP {name} {help_text}\n"
+                f"# TYPE {name} {prom_type}\n"
+                f"{name} {latest.value}"
+            )
+            self._prometheus_blocks[name] = (latest, block)
+            prometheus_blocks.append(block)
 
-                # Add metric value
-                prometheus_lines.append(f"{name} {current_value}")
+        return "\n".join(prometheus_blocks)
 
-        return "\n".join(prometheus_lines)
+    async def save_metrics_snapshot(
+        self, active_alerts: Optional[List[Dict[str, Any]]] = None
+    ):
+        """Append a metrics snapshot to the snapshot history file.
 
-    async def save_metrics_snapshot(self):
-        """Save current metrics snapshot to file."""
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        snapshot_file = self.storage_dir / f"metrics_snapshot_{timestamp}.json"
+        Pass ``active_alerts`` to reuse a list already computed this cycle.
+        """
+        if active_alerts is None:
+            active_alerts = self.get_active_alerts()
 
+        # One clock reading stamps the snapshot and everything inside it
+        timestamp = _format_utc(time.time())
         snapshot_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "metrics": self.get_all_metrics_data(),
-            "active_alerts": self.get_active_alerts(),
+            "timestamp": timestamp,
+            "metrics": self.get_all_metrics_data(timestamp),
+            "active_alerts": active_alerts,
             "dashboards": {
-                name: self.get_dashboard_data(name) for name in self.dashboards
+                name: self._build_dashboard_data(dashboard, timestamp)
+                for name, dashboard in self.dashboards.items()
             },
         }
 
-        with open(snapshot_file, "w", encoding="utf-8") as f:
-            json.dump(snapshot_data, f, indent=2)
+        # Compact, one line per snapshot, since snapshots are read back by
+        # tools rather than people (export_metrics gives the indented form);
+        # written off the event loop
+        payload = _dump_json(snapshot_data)
+        snapshot_file = await asyncio.to_thread(self._append_snapshot, payload)
 
-        logger.info(f"📊 Metrics snapshot saved: {snapshot_file}")
+        logger.info("📊 Metrics snapshot saved: %s", snapshot_file)
 
         return str(snapshot_file)
 
-    def generate_report(self, time_range: str = "24h") -> Dict[str, Any]:
-        """Generate comprehensive metrics report."""
-        report_time = datetime.utcnow()
+    def generate_report(
+        self,
+        time_range: str = "24h",
+        active_alerts: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Generate comprehensive metrics report.
+
+        Pass ``active_alerts`` to reuse a list already computed this cycle.
+        """
+        report_time = time.time()
 
         # Parse time range
         if time_range.endswith("h"):
             hours = int(time_range[:-1])
-            since = report_time - timedelta(hours=hours)
+            since = report_time - hours * 3600
         elif time_range.endswith("d"):
             days = int(time_range[:-1])
-            since = report_time - timedelta(days=days)
+            since = report_time - days * 86400
         else:
-            since = report_time - timedelta(hours=24)  # Default to 24h
+            since = report_time - 24 * 3600  # Default to 24h
 
         report = {
-            "report_timestamp": report_time.isoformat() + "Z",
+            "report_timestamp": _format_utc(report_time),
             "time_range": time_range,
-            "since_timestamp": since.isoformat() + "Z",
+            "since_timestamp": _format_utc(since),
             "summary": {},
             "key_metrics": {},
             "alerts_summary": {},
@@ -1053,15 +1380,7 @@ class ConstitutionalMetricsCollector:
         }
 
         # Key metrics summary
-        key_metrics = [
-            "constitutional_compliance_score",
-            "quality_gates_pass_rate",
-            "code_coverage_percentage",
-            "security_vulnerabilities_total",
-            "constitutional_violations_total",
-        ]
-
-        for metric_name in key_metrics:
+        for metric_name in self._KEY_METRICS:
             if metric_name in self.metrics:
                 report["key_metrics"][metric_name] = self.get_metric_summary(
                     metric_name
@@ -1069,7 +1388,8 @@ class ConstitutionalMetricsCollector:
 
         # Alert summary
         total_alerts = len(self.alerts)
-        active_alerts = self.get_active_alerts()
+        if active_alerts is None:
+            active_alerts = self.get_active_alerts()
 
         report["alerts_summary"] = {
             "total_alerts_configured": total_alerts,
@@ -1081,13 +1401,8 @@ class ConstitutionalMetricsCollector:
         report["recommendations"] = self._generate_recommendations()
 
         # Overall summary
-        compliance_score = (
-            self.metrics.get("constitutional_compliance_score", {}).get_current_value()
-            or 0
-        )
-        pass_rate = (
-            self.metrics.get("quality_gates_pass_rate", {}).get_current_value() or 0
-        )
+        compliance_score = self._cv("constitutional_compliance_score")
+        pass_rate = self._cv("quality_gates_pass_rate")
 
         report["summary"] = {
             "overall_health": (
@@ -1098,65 +1413,38 @@ class ConstitutionalMetricsCollector:
             "compliance_score": compliance_score,
             "quality_gate_pass_rate": pass_rate,
             "active_alerts_count": len(active_alerts),
-            "critical_alerts": len(
-                [a for a in active_alerts if a["severity"] == "critical"]
+            "critical_alerts": sum(
+                1 for a in active_alerts if a["severity"] == "critical"
             ),
         }
 
         return report
 
+    def _cv(self, name: str, default: Union[int, float] = 0) -> Union[int, float]:
+        """Get a metric's current value, or ``default`` if it has none."""
+        metric = self.metrics.get(name)
+        if metric is None or not metric.values:
+            return default
+        return metric.values[-1].value
+
     def _generate_recommendations(self) -> List[str]:
         """Generate recommendations based on current metrics."""
         recommendations = []
 
-        # Coverage recommendations
-        coverage = (
-            self.metrics.get("code_coverage_percentage", {}).get_current_value() or 0
-        )
-        if coverage < 80:
-            recommendations.append(
-                f"Code coverage is {coverage:.1f}%. Consider adding more tests to reach 80% threshold."
-            )
-
-        # Security recommendations
-        critical_vulns = (
-            self.metrics.get(
-                "security_vulnerabilities_critical", {}
-            ).get_current_value()
-            or 0
-        )
-        if critical_vulns > 0:
-            recommendations.append(
-                f"Address {critical_vulns} critical security vulnerabilities immediately."
-            )
-
-        # Performance recommendations
-        avg_exec_time = self.metrics.get("quality_gate_execution_time", {})
-        if avg_exec_time.values:
-            recent_times = [
-                v.value for v in avg_exec_time.values[-10:]
-            ]  # Last 10 values
-            if recent_times and statistics.mean(recent_times) > 1.0:
-                recommendations.append(
-                    "Quality gate execution time is high. Consider optimizing validation processes."
+        for rule in self._RECOMMENDATION_RULES:
+            if rule.window:
+                # Windowed rules compare the mean of the most recent values
+                metric = self.metrics.get(rule.metric_name)
+                if metric is None or not metric.values:
+                    continue
+                value = statistics.fmean(
+                    v.value for v in metric.get_recent_values(rule.window)
                 )
+            else:
+                value = self._cv(rule.metric_name)
 
-        # Constitutional recommendations
-        violations = (
-            self.metrics.get("constitutional_violations_total", {}).get_current_value()
-            or 0
-        )
-        if violations > 5:
-            recommendations.append(
-                f"High number of constitutional violations ({violations}). Review code for SRP and maintainability issues."
-            )
-
-        # System recommendations
-        memory_usage = self.metrics.get("memory_usage_mb", {}).get_current_value() or 0
-        if memory_usage > 500:
-            recommendations.append(
-                f"High memory usage ({memory_usage:.1f}MB). Monitor for memory leaks."
-            )
+            if rule.compare(value, rule.threshold):
+                recommendations.append(rule.template.format(value=value))
 
         return recommendations
 
@@ -1176,12 +1464,13 @@ async def simulate_constitutional_activity(collector: ConstitutionalMetricsColle
         else:
             collector.increment_counter("quality_gates_failed")
 
-        # Simulate execution time
-        execution_time = 0.5 + (i * 0.1)  # Gradually increasing time
-        collector.record_metric("quality_gate_execution_time", execution_time)
-
         await asyncio.sleep(0.1)
 
+    # Simulate execution times, gradually increasing
+    collector.record_many(
+        "quality_gate_execution_time", [0.5 + (i * 0.1) for i in range(5)]
+    )
+
     # Set some gauge values
     collector.set_gauge("code_coverage_percentage", 85.5)
     collector.set_gauge("code_complexity_average", 4.2)
@@ -1245,7 +1534,7 @@ async def main():
 
         # Generate a report
         print(f"\n📋 Generating metrics report...")
-        report = collector.generate_report("1h")
+        report = collector.generate_report("1h", active_alerts)
         print(f"📊 Overall Health: {report['summary']['overall_health']}")
         print(f"📈 Compliance Score: {report['summary']['compliance_score']:.1f}")
 
@@ -1255,12 +1544,13 @@ async def main():
                 print(f"  • {rec}")
 
         # Save a snapshot
-        snapshot_file = await collector.save_metrics_snapshot()
+        snapshot_file = await collector.save_metrics_snapshot(active_alerts)
         print(f"\n💾 Metrics snapshot saved: {Path(snapshot_file).name}")
 
     finally:
         # Stop collection
         collector.stop_collection()
+        collector.close()
 
     print("✅ Metrics collection and monitoring system ready!")
 
@@ -0,0 +1,104 @@
+"""
+Unit tests for ConstitutionalHelpSystem class.
+
+Tests help lookup, principle listing, and help content search.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Import test subjects
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from help_system import ConstitutionalHelpSystem, get_help_system
+
+
+class TestConstitutionalHelpSystem:
+    """Test cases for ConstitutionalHelpSystem class."""
+
+    def test_initialization(self):
+        """Test ConstitutionalHelpSystem initialization."""
+        help_system = ConstitutionalHelpSystem()
+
+        assert len(help_system.principles) == 8
+        assert "srp" in help_system.principles
+        assert "getting-started" in help_system.help_topics
+        assert "complexity" in help_system.quick_fixes
+
+    def test_show_principle_help(self):
+        """Test showing help for a constitutional principle."""
+        help_system = ConstitutionalHelpSystem()
+
+        help_text = help_system.show_help("srp")
+
+        assert "Single Responsibility Principle (SRP)" in help_text
+        assert "Functions that do multiple unrelated tasks" in help_text
+
+    def test_show_unknown_topic(self):
+        """Test showing help for an unknown topic."""
+        help_system = ConstitutionalHelpSystem()
+
+        help_text = help_system.show_help("no-such-topic")
+
+        assert "Unknown help topic: no-such-topic" in help_text
+        assert "getting-started" in help_text
+
+    def test_search_help_matches_partial_word(self):
+        """Test search matches queries inside longer words."""
+        help_system = ConstitutionalHelpSystem()
+
+        results = help_system.search_help("INJECT")
+
+        assert "principle:defensibility" in results
+        assert "fix:security" in results
+
+    def test_search_help_matches_phrase(self):
+        """Test search matches multi-word queries."""
+        help_system = ConstitutionalHelpSystem()
+
+        results = help_system.search_help("test coverage")
+
+        assert "topic:quality-gates" in results
+        assert "topic:violations" in results
+        assert "principle:srp" not in results
+
+    def test_search_help_no_results(self):
+        """Test search with no matching content."""
+        help_system = ConstitutionalHelpSystem()
+
+        results = help_system.search_help("xyzzy")
+
+        assert "No help found for 'xyzzy'" in results
+
+    def test_get_help_system_returns_shared_instance(self):
+        """Test the module-level help system accessor reuses one instance."""
+        help_system = get_help_system()
+
+        assert isinstance(help_system, ConstitutionalHelpSystem)
+        assert get_help_system() is help_system
+
+    def test_principles_built_from_data_records(self):
+        """Test every principle record materializes with its help key."""
+        help_system = ConstitutionalHelpSystem()
+
+        assert list(help_system.principles) == [
+            "srp",
+            "encapsulation",
+            "loose_coupling",
+            "reusability",
+            "portability",
+            "defensibility",
+            "maintainability",
+            "simplicity",
+        ]
+        assert help_system.principles["reusability"].short_name == "DRY"
+
+    def test_help_entries_hashable(self):
+        """Test principles and help topics can be hashed and used in sets."""
+        help_system = ConstitutionalHelpSystem()
+
+        assert len(set(help_system.principles.values())) == len(help_system.principles)
+        assert len(set(help_system.help_topics.values())) == len(
+            help_system.help_topics
+        )
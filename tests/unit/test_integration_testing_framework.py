@@ -0,0 +1,671 @@
+"""
+Unit tests for ConstitutionalIntegrationTestFramework class.
+
+Tests scenario registration, environment setup, and scenario execution.
+"""
+
+import asyncio
+import json
+import os
+import pickle
+import pytest
+import sys
+import time
+import yaml
+from pathlib import Path
+
+# Import test subjects
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from integration_testing_framework import (
+    ConstitutionalIntegrationTestFramework,
+    IntegrationTestScenario,
+    Predicate,
+    _directory_remover,
+    _format_utc_ns,
+    load_results,
+)
+
+
+def _worker_modules():
+    """Return the names of the modules loaded in a worker process."""
+    return set(sys.modules)
+
+
+def _crash_worker(env):
+    """Test step that kills its process like a C extension segfault."""
+    os._exit(1)
+
+
+class TestPredicate:
+    """Test cases for Predicate class."""
+
+    def test_comparison(self):
+        """Test predicates compare the actual value against their operand."""
+        at_least_80 = Predicate("ge", 80.0)
+
+        assert at_least_80(85.0)
+        assert at_least_80(80.0)
+        assert not at_least_80(79.9)
+        assert str(at_least_80) == ">= 80.0"
+
+    def test_unknown_operator(self):
+        """Test unknown operators are rejected at construction."""
+        with pytest.raises(ValueError):
+            Predicate("between", 1)
+
+    def test_pickle_round_trip(self):
+        """Test predicates survive pickling."""
+        restored = pickle.loads(pickle.dumps(Predicate("gt", 0)))
+
+        assert restored == Predicate("gt", 0)
+        assert restored(1)
+        assert not restored(0)
+
+
+class TestFormatUtcNs:
+    """Test cases for result timestamp formatting."""
+
+    def test_formats_microseconds_with_z_suffix(self):
+        """Test nanosecond timestamps format as ISO 8601 UTC microseconds."""
+        assert _format_utc_ns(1_700_000_000_123_456_789) == "2023-11-14T22:13:20.123456Z"
+        assert _format_utc_ns(0) == "1970-01-01T00:00:00.000000Z"
+
+
+class TestConstitutionalIntegrationTestFramework:
+    """Test cases for ConstitutionalIntegrationTestFramework class."""
+
+    def test_initialization(self, tmp_path):
+        """Test framework initialization registers all scenarios."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+
+        assert len(framework.scenarios) == 7
+        assert "coverage_validation_integration" in framework.scenarios
+        assert "full_constitutional_validation" in framework.scenarios
+
+    def test_environment_creates_project_layout(self, tmp_path):
+        """Test environments start with the standard and requested dirs."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+
+        with framework.test_environment(("docs/api",)) as env:
+            assert env.src_dir == env.project_dir / "src"
+            assert env.src_dir.is_dir()
+            assert env.tests_dir.is_dir()
+            assert env.config_dir.is_dir()
+            assert env.templates_dir == env.project_dir / ".kittify" / "templates"
+            assert env.templates_dir.is_dir()
+            assert (env.project_dir / "docs" / "api").is_dir()
+
+    def test_setup_config_writes_yaml(self, tmp_path):
+        """Test config setup steps write the expected YAML files."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+
+        with framework.test_environment() as env:
+            result = framework._setup_naming_config(env)
+            config = yaml.safe_load(
+                (env.config_dir / "naming_conventions.yaml").read_text()
+            )
+            written = [path.name for path in env.config_dir.iterdir()]
+
+        assert result == {"naming_config_created": True}
+        assert written == ["naming_conventions.yaml"]  # No temp files left behind
+        assert config["naming_conventions"]["enforcement_level"] == "strict"
+
+    def test_run_scenario(self, tmp_path):
+        """Test running a scenario end to end."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+
+        result = asyncio.run(framework.run_scenario("template_drift_integration"))
+
+        assert result["status"] == "passed"
+        assert result["outcomes"]["drift_detected"] is True
+        assert result["errors"] == []
+
+    def test_run_scenario_json(self, tmp_path):
+        """Test running a scenario with JSON-serialized results."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+
+        payload = asyncio.run(
+            framework.run_scenario_json("naming_validation_integration")
+        )
+        result = json.loads(payload)
+
+        assert isinstance(payload, bytes)
+        assert result["scenario_name"] == "naming_validation_integration"
+        assert result["status"] == "passed"
+
+    def test_run_unknown_scenario(self, tmp_path):
+        """Test running an unknown scenario raises ValueError."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+
+        with pytest.raises(ValueError):
+            asyncio.run(framework.run_scenario("no_such_scenario"))
+
+    def test_rerun_clones_setup_project(self, tmp_path):
+        """Test reruns clone the project built by the first setup."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+
+        first = asyncio.run(framework.run_scenario("naming_validation_integration"))
+        second = asyncio.run(framework.run_scenario("naming_validation_integration"))
+
+        assert first["status"] == second["status"] == "passed"
+        assert second["steps_completed"] == first["steps_completed"]
+
+        with framework.test_environment() as env:
+            assert framework._clone_setup_template(
+                "naming_validation_integration", env
+            )
+            assert (env.project_dir / "src" / "BadNaming.py").exists()
+            assert (env.config_dir / "naming_conventions.yaml").exists()
+
+    def test_setup_reruns_unless_scenario_opts_in(self, tmp_path):
+        """Test setup steps run in order on every run by default."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+        setup_runs = []
+
+        def first_setup(env):
+            setup_runs.append("first")
+
+        def second_setup(env):
+            setup_runs.append("second")
+
+        framework.scenarios["plain_setup"] = IntegrationTestScenario(
+            name="plain_setup",
+            description="Scenario using the default setup behavior",
+            setup_steps=[first_setup, second_setup],
+            test_steps=[],
+            cleanup_steps=[],
+            expected_outcomes={},
+        )
+
+        for _ in range(2):
+            result = asyncio.run(framework.run_scenario("plain_setup"))
+            assert result["status"] == "passed"
+
+        assert setup_runs == ["first", "second", "first", "second"]
+        assert framework._setup_templates == {}
+
+    def test_parallel_setup_failure_is_reported(self, tmp_path):
+        """Test a failing concurrent setup step fails the scenario."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+
+        def failing_setup(env):
+            raise RuntimeError("boom")
+
+        framework.scenarios["failing_setup"] = IntegrationTestScenario(
+            name="failing_setup",
+            description="Scenario with a failing setup step",
+            setup_steps=[framework._setup_naming_config, failing_setup],
+            test_steps=[],
+            cleanup_steps=[],
+            expected_outcomes={},
+            parallel_setup=True,
+        )
+
+        result = asyncio.run(framework.run_scenario("failing_setup"))
+
+        assert result["status"] == "failed"
+        assert result["steps_completed"] == ["setup_0"]
+        assert result["steps_failed"] == ["setup_1"]
+        assert "Setup step 1 failed: boom" in result["errors"]
+
+    def test_parallel_setup_timeout_is_reported(self, tmp_path):
+        """Test an overrunning concurrent setup step fails and is waited for."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+        finished = []
+
+        def quick_setup(env):
+            return {"quick": True}
+
+        def slow_setup(env):
+            time.sleep(1.5)
+            finished.append(env.project_dir.exists())
+
+        framework.scenarios["slow_setup"] = IntegrationTestScenario(
+            name="slow_setup",
+            description="Scenario with an overrunning setup step",
+            setup_steps=[quick_setup, slow_setup],
+            test_steps=[],
+            cleanup_steps=[],
+            expected_outcomes={},
+            timeout_seconds=0.5,
+            parallel_setup=True,
+        )
+
+        result = asyncio.run(framework.run_scenario("slow_setup"))
+
+        assert result["status"] == "failed"
+        assert result["steps_completed"] == ["setup_0"]
+        assert result["steps_failed"] == ["setup_1"]
+        assert "Setup step 1 failed: timed out after 0.5s" in result["errors"]
+        # The step's thread finished before cleanup removed the project
+        assert finished == [True]
+
+    def test_run_scenario_in_subprocess(self, tmp_path):
+        """Test isolated scenarios ship results back from a reused worker pool."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+
+        async def run_twice():
+            first = await framework.run_scenario(
+                "naming_validation_integration", subprocess_isolate=True
+            )
+            pool = framework._worker_pool
+            second = await framework.run_scenario(
+                "template_drift_integration", subprocess_isolate=True
+            )
+            return first, second, pool
+
+        try:
+            first, second, pool = asyncio.run(run_twice())
+            assert framework._worker_pool is pool
+        finally:
+            framework.close()
+
+        assert first["status"] == second["status"] == "passed"
+        assert first["outcomes"]["naming_violations_detected"] > 0
+        assert framework._worker_pool is None
+
+    def test_subprocess_setup_template_recorded_in_parent(self, tmp_path):
+        """Test setups saved by isolated runs are reused by later runs."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+
+        async def run_twice():
+            first = await framework.run_scenario(
+                "naming_validation_integration", subprocess_isolate=True
+            )
+            template_dir = framework._setup_templates.get(
+                "naming_validation_integration"
+            )
+            second = await framework.run_scenario(
+                "naming_validation_integration", subprocess_isolate=True
+            )
+            return first, second, template_dir
+
+        try:
+            first, second, template_dir = asyncio.run(run_twice())
+        finally:
+            framework.close()
+
+        assert first["status"] == second["status"] == "passed"
+        assert (template_dir / "src" / "BadNaming.py").exists()
+        # The rerun cloned the recorded template rather than saving another
+        assert framework._setup_templates == {
+            "naming_validation_integration": template_dir
+        }
+        assert len(list(framework._setup_template_root.iterdir())) == 1
+
+    def test_subprocess_crash_fails_only_the_scenario(self, tmp_path):
+        """Test a worker crash fails its scenario and the pool recovers."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+        framework.scenarios["crashing_step"] = IntegrationTestScenario(
+            name="crashing_step",
+            description="Scenario whose test step kills its process",
+            setup_steps=[],
+            test_steps=[_crash_worker],
+            cleanup_steps=[],
+            expected_outcomes={},
+        )
+
+        async def crash_then_run():
+            crashed = await framework.run_scenario(
+                "crashing_step", subprocess_isolate=True
+            )
+            recovered = await framework.run_scenario(
+                "naming_validation_integration", subprocess_isolate=True
+            )
+            return crashed, recovered
+
+        try:
+            crashed, recovered = asyncio.run(crash_then_run())
+        finally:
+            framework.close()
+
+        assert crashed["status"] == "failed"
+        assert crashed["errors"][0].startswith("Scenario subprocess failed")
+        assert "end_time" in crashed
+        assert recovered["status"] == "passed"
+
+    def test_result_cache_reuses_passed_results(self, tmp_path):
+        """Test passed results are served from the cache by later frameworks."""
+        cache_path = tmp_path / "cache" / "scenario_results.sqlite"
+        framework = ConstitutionalIntegrationTestFramework(tmp_path, cache_path)
+        first = asyncio.run(framework.run_scenario("naming_validation_integration"))
+        framework.close()
+
+        rerun = ConstitutionalIntegrationTestFramework(tmp_path, cache_path)
+        try:
+            second = asyncio.run(rerun.run_scenario("naming_validation_integration"))
+        finally:
+            rerun.close()
+
+        # A real rerun would have recorded its own start time
+        assert second.pop("cached") is True
+        assert second == first
+        assert "cached" not in first
+
+    def test_result_cache_skips_failed_results(self, tmp_path):
+        """Test failed results are rerun rather than cached."""
+        cache_path = tmp_path / "scenario_results.sqlite"
+        framework = ConstitutionalIntegrationTestFramework(tmp_path, cache_path)
+        calls = []
+
+        def failing_test(env):
+            calls.append(env)
+            raise RuntimeError("boom")
+
+        framework.scenarios["failing_test"] = IntegrationTestScenario(
+            name="failing_test",
+            description="Scenario with a failing test step",
+            setup_steps=[],
+            test_steps=[failing_test],
+            cleanup_steps=[],
+            expected_outcomes={},
+        )
+
+        try:
+            for _ in range(2):
+                result = asyncio.run(framework.run_scenario("failing_test"))
+                assert result["status"] == "failed"
+        finally:
+            framework.close()
+
+        assert len(calls) == 2
+
+    def test_result_cache_key_tracks_analyzer_sources(self, tmp_path, monkeypatch):
+        """Test editing a module the analyzer steps delegate to changes the key."""
+        analyzer_file = tmp_path / "fake_analyzer.py"
+        analyzer_file.write_text("RULES = 1\n")
+        fake_module = type(sys)("fake_analyzer")
+        fake_module.__file__ = str(analyzer_file)
+        monkeypatch.setitem(sys.modules, "fake_analyzer", fake_module)
+        monkeypatch.setattr(
+            "integration_testing_framework._ANALYZER_MODULES", ("fake_analyzer",)
+        )
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+        scenario = framework.scenarios["naming_validation_integration"]
+
+        before = framework._scenario_cache_key(scenario)
+        analyzer_file.write_text("RULES = 22\n")
+
+        assert framework._scenario_cache_key(scenario) != before
+
+    def test_outcomes_start_with_expected_keys(self, tmp_path):
+        """Test expected outcomes a scenario never produces are recorded as None."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+        framework.scenarios["missing_outcome"] = IntegrationTestScenario(
+            name="missing_outcome",
+            description="Scenario expecting an outcome no step produces",
+            setup_steps=[],
+            test_steps=[framework._setup_naming_config],
+            cleanup_steps=[],
+            expected_outcomes={"never_produced": True, "naming_config_created": True},
+        )
+
+        result = asyncio.run(framework.run_scenario("missing_outcome"))
+
+        assert framework.scenarios["missing_outcome"].outcome_keys == (
+            "never_produced",
+            "naming_config_created",
+        )
+        assert result["outcomes"] == {
+            "never_produced": None,
+            "naming_config_created": True,
+        }
+        assert result["status"] == "failed"
+
+    def test_test_phase_deadline(self, tmp_path):
+        """Test the scenario timeout bounds the test phase as a whole."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+
+        async def quick_step(env):
+            await asyncio.sleep(0.05)
+            return {"quick": True}
+
+        async def slow_step(env):
+            await asyncio.sleep(30)
+
+        framework.scenarios["slow_test"] = IntegrationTestScenario(
+            name="slow_test",
+            description="Scenario whose test phase overruns its deadline",
+            setup_steps=[],
+            test_steps=[quick_step, slow_step],
+            cleanup_steps=[],
+            expected_outcomes={},
+            timeout_seconds=0.2,
+        )
+
+        started = time.monotonic()
+        result = asyncio.run(framework.run_scenario("slow_test"))
+
+        assert time.monotonic() - started < 5
+        assert result["status"] == "failed"
+        assert result["steps_completed"] == ["test_0"]
+        assert result["steps_failed"] == ["test_1"]
+        assert result["outcomes"] == {"quick": True}
+
+    def test_coverage_validation_reuses_pytest_worker(self, tmp_path):
+        """Test each project's tests run against its own sources in one worker."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+        workers = []
+
+        try:
+            for _ in range(2):
+                with framework.test_environment() as env:
+                    framework._setup_python_project_with_tests(env)
+                    result = asyncio.run(framework._run_coverage_validation(env))
+                workers.append(framework._pytest_worker)
+
+                assert result["coverage_command_success"] is True
+                if "error" not in result:  # coverage installed
+                    assert result["coverage_percentage"] == 100.0
+        finally:
+            framework.close()
+
+        assert workers[0] is workers[1]
+        assert framework._pytest_worker is None
+
+    def test_coverage_validation_captures_pytest_output(self, tmp_path):
+        """Test pytest's output is kept in the results of a failing run."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+
+        try:
+            with framework.test_environment() as env:
+                framework._setup_python_project_with_tests(env)
+                passing = asyncio.run(framework._run_coverage_validation(env))
+                (env.tests_dir / "test_main.py").write_text(
+                    "def test_fails():\n    assert False\n"
+                )
+                failing = asyncio.run(framework._run_coverage_validation(env))
+        finally:
+            framework.close()
+
+        assert "pytest_output" not in passing
+        assert failing["coverage_command_success"] is False
+        assert "1 failed" in failing["pytest_output"]
+
+    def test_pytest_worker_keeps_pytest_modules_loaded(self, tmp_path):
+        """Test only the project's modules are dropped between worker runs."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+        loaded = []
+
+        try:
+            for _ in range(2):
+                with framework.test_environment() as env:
+                    framework._setup_python_project_with_tests(env)
+                    result = asyncio.run(framework._run_coverage_validation(env))
+                assert result["coverage_command_success"] is True
+                loaded.append(framework._pytest_worker.submit(_worker_modules).result())
+        finally:
+            framework.close()
+
+        # pytest's builtin plugins are imported by the first run and kept
+        assert "_pytest.skipping" in loaded[0]
+        assert "_pytest.junitxml" in loaded[1]
+        assert loaded[1] == loaded[0]
+        assert "test_main" not in loaded[1]
+        assert "main" not in loaded[1]
+
+    def test_analysis_results_reused_for_cloned_projects(self, tmp_path):
+        """Test analyzers run once for a project tree reused by a rerun."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+
+        first = asyncio.run(framework.run_scenario("naming_validation_integration"))
+        cached = dict(framework._analysis_cache)
+        second = asyncio.run(framework.run_scenario("naming_validation_integration"))
+
+        assert [analyzer for analyzer, _ in cached] == ["naming"]
+        assert framework._analysis_cache == cached
+        assert second["outcomes"] == first["outcomes"]
+
+    def test_analysis_cache_misses_on_changed_project(self, tmp_path):
+        """Test a changed project tree is analyzed again."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+
+        with framework.test_environment() as env:
+            framework._setup_project_with_naming_violations(env)
+            asyncio.run(framework._run_naming_validation(env))
+            (env.src_dir / "extra.py").write_text("x = 1\n")
+            asyncio.run(framework._run_naming_validation(env))
+
+        assert len(framework._analysis_cache) == 2
+
+    def test_run_all_scenarios_bounds_concurrency(self, tmp_path):
+        """Test scenarios run concurrently up to the requested limit."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+        running = []
+        peak = []
+
+        async def tracked_step(env):
+            running.append(env)
+            peak.append(len(running))
+            await asyncio.sleep(0.05)
+            running.remove(env)
+            return {"tracked": True}
+
+        framework.scenarios = {
+            f"tracked_{i}": IntegrationTestScenario(
+                name=f"tracked_{i}",
+                description="Scenario tracking concurrent runs",
+                setup_steps=[],
+                test_steps=[tracked_step],
+                cleanup_steps=[],
+                expected_outcomes={"tracked": True},
+            )
+            for i in range(4)
+        }
+
+        results = asyncio.run(framework.run_all_scenarios(max_concurrency=2))
+
+        assert max(peak) == 2
+        assert list(results["scenarios"]) == [f"tracked_{i}" for i in range(4)]
+        assert results["summary"]["passed"] == 4
+
+    def test_complete_project_fixture_built_once(self, tmp_path):
+        """Test the complete project is built once and copied into each env."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+
+        for _ in range(2):
+            with framework.test_environment() as env:
+                result = framework._setup_complete_test_project(env)
+                assert (env.src_dir / "BadNaming.py").exists()
+                assert (env.tests_dir / "test_main.py").exists()
+            assert result["naming_violations_created"] is True
+
+        assert list(framework._fixtures) == ["complete_project"]
+
+    def test_constant_result_steps(self, tmp_path):
+        """Test (name, outcomes) steps record their outcomes without running."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+        framework.scenarios["constant_steps"] = IntegrationTestScenario(
+            name="constant_steps",
+            description="Scenario made of constant-result steps",
+            setup_steps=[("setup_marker", {"set_up": True})],
+            test_steps=[("verify_marker", {"verified": True})],
+            cleanup_steps=[("cleanup_marker", {})],
+            expected_outcomes={"verified": True},
+        )
+
+        result = asyncio.run(framework.run_scenario("constant_steps"))
+
+        assert result["status"] == "passed"
+        assert result["steps_completed"] == ["setup_0", "test_0"]
+        assert result["outcomes"] == {"verified": True}
+
+    def test_run_all_scenarios_streams_results(self, tmp_path):
+        """Test results stream to NDJSON while only the summary is returned."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+        kept = ("naming_validation_integration", "template_drift_integration")
+        framework.scenarios = {name: framework.scenarios[name] for name in kept}
+        results_path = tmp_path / "results.ndjson"
+
+        all_results = asyncio.run(
+            framework.run_all_scenarios(results_path=results_path)
+        )
+        streamed = list(load_results(results_path))
+
+        assert "scenarios" not in all_results
+        assert all_results["summary"]["passed"] == 2
+        assert sorted(result["scenario_name"] for result in streamed) == list(kept)
+        assert all(result["status"] == "passed" for result in streamed)
+
+    def test_load_results_empty_file(self, tmp_path):
+        """Test a results file with no scenarios yields nothing."""
+        results_path = tmp_path / "results.ndjson"
+        results_path.write_bytes(b"")
+
+        assert list(load_results(results_path)) == []
+
+    def test_scenarios_sharing_fixture_key_share_setup(self, tmp_path):
+        """Test scenarios with the same fixture key build their setup once."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+        setup_runs = []
+
+        def counted_setup(env):
+            setup_runs.append(env)
+            return framework._setup_project_with_naming_violations(env)
+
+        def has_bad_naming(env):
+            return {"bad_naming": (env.src_dir / "BadNaming.py").exists()}
+
+        for name in ("first_naming", "second_naming"):
+            framework.scenarios[name] = IntegrationTestScenario(
+                name=name,
+                description="Scenario sharing the naming fixture",
+                setup_steps=[counted_setup],
+                test_steps=[has_bad_naming],
+                cleanup_steps=[],
+                expected_outcomes={"bad_naming": True},
+                fixture_key="naming_project",
+                reuse_setup=True,
+            )
+
+        first = asyncio.run(framework.run_scenario("first_naming"))
+        second = asyncio.run(framework.run_scenario("second_naming"))
+
+        assert first["status"] == second["status"] == "passed"
+        assert len(setup_runs) == 1
+        assert list(framework._setup_templates) == ["naming_project"]
+
+    @pytest.mark.skipif(os.name != "posix", reason="Process groups are POSIX only")
+    def test_cleanup_terminates_processes(self, tmp_path):
+        """Test environment cleanup stops started processes promptly."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+
+        with framework.test_environment() as env:
+            processes = [env.start_process(["sleep", "30"]) for _ in range(3)]
+            started = time.monotonic()
+
+        assert time.monotonic() - started < 5
+        assert all(process.returncode is not None for process in processes)
+
+    def test_cleanup_removes_project_directory(self, tmp_path):
+        """Test environment cleanup removes the project directory."""
+        framework = ConstitutionalIntegrationTestFramework(tmp_path)
+
+        with framework.test_environment() as env:
+            framework._setup_python_project_with_tests(env)
+            project_dir = env.project_dir
+
+        assert not project_dir.exists()
+        _directory_remover.wait()
+        assert not list(project_dir.parent.glob(f"{project_dir.name}.trash-*"))
@@ -0,0 +1,249 @@
+"""
+Unit tests for ConstitutionalMetricsCollector class.
+
+Tests alert conditions, metric history queries, Prometheus export, batch
+recording, and report generation.
+"""
+
+import asyncio
+import json
+import pytest
+import sys
+from pathlib import Path
+
+pytest.importorskip("psutil")
+
+# Import test subjects
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from metrics_monitoring_system import (
+    Alert,
+    AlertSeverity,
+    ConstitutionalMetricsCollector,
+    Metric,
+    MetricType,
+)
+
+
+@pytest.fixture
+def collector(tmp_path):
+    """Create a collector storing its files under a temporary directory."""
+    collector = ConstitutionalMetricsCollector(tmp_path)
+    yield collector
+    collector.close()
+
+
+def _alert(condition: str) -> Alert:
+    """Create an alert with the given condition."""
+    return Alert(
+        name="test_alert",
+        description="Test alert",
+        metric_name="test_metric",
+        condition=condition,
+        severity=AlertSeverity.WARNING,
+    )
+
+
+class TestAlert:
+    """Test cases for Alert class."""
+
+    @pytest.mark.parametrize(
+        "condition, value, expected",
+        [
+            ("> 80", 81, True),
+            ("> 80", 80, False),
+            (">= 80", 80, True),
+            (">= 80", 79.9, False),
+            ("< 90", 89, True),
+            ("< 90", 90, False),
+            ("<= 90", 90, True),
+            ("<= 90", 90.1, False),
+            ("== 0", 0, True),
+            ("== 0", 1, False),
+            ("!= 0", 1, True),
+            ("!= 0", 0, False),
+            ("<-1.5", -2, True),
+            ("> 1e3", 1001, True),
+        ],
+    )
+    def test_condition_operators(self, condition, value, expected):
+        """Test each comparison operator against its threshold."""
+        assert _alert(condition).should_trigger(value) is expected
+
+    @pytest.mark.parametrize(
+        "condition",
+        [
+            "",
+            "80",
+            "> ",
+            "=> 80",
+            "> eighty",
+            "> 80 and True",
+            "> 80; import os",
+            "__import__('os').system('true')",
+            "> (lambda: 80)()",
+        ],
+    )
+    def test_invalid_condition_rejected(self, condition):
+        """Test malformed and injected conditions are rejected at registration."""
+        with pytest.raises(ValueError):
+            _alert(condition)
+
+    def test_condition_reassignment(self):
+        """Test a reassigned condition is evaluated, and invalid ones rejected."""
+        alert = _alert("> 80")
+        alert.condition = "< 10"
+
+        assert alert.should_trigger(5)
+        assert not alert.should_trigger(81)
+
+        with pytest.raises(ValueError):
+            alert.condition = "> 80 or True"
+        assert alert.condition == "< 10"
+        assert alert.should_trigger(5)
+
+    def test_cooldown_suppresses_trigger(self):
+        """Test a recently triggered alert does not trigger again."""
+        alert = _alert("> 80")
+        alert.last_triggered = 0.0
+        assert alert.should_trigger(81)
+
+        alert.last_triggered = float("inf")
+        assert not alert.should_trigger(81)
+
+
+class TestMetric:
+    """Test cases for Metric class."""
+
+    def _metric(self, capacity: int = 1000) -> Metric:
+        """Create a gauge metric with samples at timestamps 1 through 5."""
+        metric = Metric(
+            name="test_metric",
+            description="Test metric",
+            metric_type=MetricType.GAUGE,
+            capacity=capacity,
+        )
+        metric.extend([10, 20, 30, 40, 50], [1.0, 2.0, 3.0, 4.0, 5.0])
+        return metric
+
+    def test_get_values_since(self):
+        """Test values are selected from the first one at or after the cutoff."""
+        metric = self._metric()
+
+        assert [v.value for v in metric.get_values_since(2.5)] == [30, 40, 50]
+        assert [v.value for v in metric.get_values_since(3.0)] == [30, 40, 50]
+        assert [v.value for v in metric.get_values_since(0.0)] == [10, 20, 30, 40, 50]
+        assert metric.get_values_since(6.0) == []
+
+    def test_get_values_since_after_eviction(self):
+        """Test the cutoff search only sees the retained samples."""
+        metric = self._metric(capacity=3)
+
+        assert [v.value for v in metric.get_values_since(0.0)] == [30, 40, 50]
+        assert [v.value for v in metric.get_values_since(4.0)] == [40, 50]
+
+    def test_get_recent_values(self):
+        """Test the most recent values come back oldest first."""
+        metric = self._metric()
+
+        assert [v.value for v in metric.get_recent_values(2)] == [40, 50]
+        assert [v.value for v in metric.get_recent_values(10)] == [10, 20, 30, 40, 50]
+        assert metric.get_recent_values(0) == []
+
+
+class TestConstitutionalMetricsCollector:
+    """Test cases for ConstitutionalMetricsCollector class."""
+
+    def test_prometheus_help_escaped(self, collector):
+        """Test backslashes and newlines in descriptions are escaped."""
+        collector.register_metric(
+            "escaped_metric", "Path C:\\temp\nsecond line", MetricType.GAUGE
+        )
+        collector.set_gauge("escaped_metric", 1)
+
+        exported = collector._export_prometheus_format()
+
+        assert "# HELP escaped_metric Path C:\\\\temp\\nsecond line\n" in exported
+        assert "# TYPE escaped_metric gauge\nescaped_metric 1" in exported
+
+    def test_prometheus_export_tracks_new_samples(self, collector):
+        """Test cached Prometheus blocks are re-rendered after a new sample."""
+        collector.register_metric("cached_metric", "Cached", MetricType.HISTOGRAM)
+        collector.record_metric("cached_metric", 1.5)
+        first = collector._export_prometheus_format()
+
+        assert collector._export_prometheus_format() == first
+
+        collector.record_metric("cached_metric", 2.5)
+        second = collector._export_prometheus_format()
+
+        assert "cached_metric 1.5" in first
+        assert "cached_metric 2.5" in second
+        assert "cached_metric 1.5" not in second
+
+    def test_record_many(self, collector):
+        """Test batches are appended in order and alert on the newest value."""
+        collector.register_metric("batch_metric", "Batch", MetricType.HISTOGRAM)
+        alert = collector.register_alert(
+            "batch_high", "Batch high", "batch_metric", "> 5", AlertSeverity.WARNING
+        )
+
+        collector.record_many("batch_metric", [10, 1])
+        assert alert.last_triggered is None
+
+        collector.record_many("batch_metric", [2, 3, 9])
+        assert alert.last_triggered is not None
+
+        values = collector.metrics["batch_metric"].values
+        assert [v.value for v in values] == [10, 1, 2, 3, 9]
+
+    def test_record_many_unregistered_metric(self, collector):
+        """Test batches for unknown metrics are ignored."""
+        collector.record_many("no_such_metric", [1, 2])
+
+        assert "no_such_metric" not in collector.metrics
+
+    def test_generate_report_with_missing_metrics(self, collector):
+        """Test reports fall back to zero for metrics that are not registered."""
+        del collector.metrics["constitutional_compliance_score"]
+        del collector.metrics["code_coverage_percentage"]
+        del collector.metrics["quality_gate_execution_time"]
+
+        report = collector.generate_report("1h")
+
+        assert report["summary"]["compliance_score"] == 0
+        assert report["summary"]["overall_health"] == "needs_attention"
+        assert "constitutional_compliance_score" not in report["key_metrics"]
+        assert report["recommendations"][0].startswith("Code coverage is 0.0%")
+
+    def test_cached_dashboard_not_shared(self, collector):
+        """Test callers cannot alter the dashboard payload cached while collecting."""
+        collector._refresh_dashboard_cache()
+        collector.collection_active = True
+        try:
+            dashboard = collector.get_dashboard_data("constitutional_compliance")
+            dashboard["name"] = "changed"
+            metric_name = next(iter(dashboard["metrics"]))
+            dashboard["metrics"][metric_name]["current_value"] = -1
+            dashboard["charts"].clear()
+            dashboard_again = collector.get_dashboard_data("constitutional_compliance")
+        finally:
+            collector.collection_active = False
+
+        assert dashboard_again["name"] == "constitutional_compliance"
+        assert dashboard_again["metrics"][metric_name]["current_value"] is None
+        assert dashboard_again["charts"]
+        assert dashboard_again is not dashboard
+
+    def test_snapshot_uses_one_timestamp(self, collector):
+        """Test every timestamp inside a snapshot record is the same reading."""
+        snapshot_path = asyncio.run(collector.save_metrics_snapshot())
+        collector.close()
+
+        lines = Path(snapshot_path).read_text().splitlines()
+        snapshot = json.loads(lines[-1])
+
+        assert snapshot["metrics"]["timestamp"] == snapshot["timestamp"]
+        assert {
+            dashboard["last_updated"] for dashboard in snapshot["dashboards"].values()
+        } == {snapshot["timestamp"]}